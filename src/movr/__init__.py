@@ -6,11 +6,23 @@ Clinical data analytics framework for neuromuscular disease registries.
 
 __version__ = "0.1.0"
 
-# High-level API exports
-from movr.data import load_data
-from movr.cohorts import CohortManager
-from movr.analytics import DescriptiveAnalyzer
-from movr.config import get_config
+# High-level API exports, imported on first access so the CLI can start
+# without pulling in pandas for commands that don't need it
+_LAZY_EXPORTS = {
+    "load_data": "movr.data",
+    "CohortManager": "movr.cohorts",
+    "DescriptiveAnalyzer": "movr.analytics",
+    "get_config": "movr.config",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'movr' has no attribute {name!r}")
 
 # Convenience functions
 def setup(excel_files=None, config_path=None):
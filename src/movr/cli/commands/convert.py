@@ -1,5 +1,6 @@
 """Convert Excel to Parquet command."""
 
+import os
 import click
 from pathlib import Path
 from rich.console import Console
@@ -70,5 +71,8 @@ def run_convert(source_dir=None, config_path=None, force=False, clean=False):
             console.print("Run 'movr setup' first or specify --source-dir")
             return
 
-        results = converter.convert_all_sources(clean_existing=clean)
+        # The CLI entry point is safe to re-import, so sheets convert in parallel
+        results = converter.convert_all_sources(
+            clean_existing=clean, max_workers=os.cpu_count() or 1
+        )
         console.print(f"\n[green]✓ Conversion complete: {len(results)} tables[/green]\n")
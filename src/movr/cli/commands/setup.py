@@ -173,6 +173,11 @@ def setup_wizard(excel_files=None, config_path=None):
             "output_dir": output_dir,
             "parquet_dir": "data/parquet",
         },
+        "conversion": {
+            "compression": "zstd",
+            "compression_level": 3,
+            "row_group_size": 131072,
+        },
         "audit": {
             "enabled": True,
             "log_dir": "data/.audit",
@@ -1,25 +1,56 @@
 """Summary statistics command."""
 
-import click
-from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import numpy as np
 import pandas as pd
 from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List
+from functools import cached_property
+from typing import Any, Optional, Dict, List
 import warnings
 
 from movr.data import load_data
-from movr.config import get_config
 
-console = Console()
+# Tables the summary metrics read; everything else in the Parquet dir is skipped
+SUMMARY_TABLES = ["demographics_maindata", "encounter_maindata", "diagnosis_maindata"]
+
+# Candidate column names per concept (actual field name first, then fallbacks)
+DISEASE_COLUMNS = ["dstype", "DISEASE", "DIAGNOSIS", "PRIMARY_DIAGNOSIS"]
+ENROLLMENT_DATE_COLUMNS = [
+    "enroldt", "ENROLLMENT_DATE", "ENROLL_DATE", "CONSENT_DATE", "FIRST_VISIT_DATE"
+]
+ENCOUNTER_DATE_COLUMNS = ["encntdt", "ENCOUNTER_DATE", "VISIT_DATE", "CASE_DATE", "DATE"]
+REGISTRY_COLUMNS = ["usndr", "REGISTRY", "DATA_SOURCE", "SOURCE"]
+
+# Metrics computed for each --metric choice (keys of SummaryReporter.METRICS)
+METRIC_GROUPS = {
+    "enrollment": ["enrollment"],
+    "recruitment": ["recruitment"],
+    "encounters": ["encounter_summary", "encounters_by_disease_year"],
+    "rates": ["avg_encounters", "avg_encounters_by_year"],
+}
+
+
+def _resolve_col(df: Optional[pd.DataFrame], candidates: List[str]) -> Optional[str]:
+    """Return the first candidate column present in df, or None."""
+    if df is None:
+        return None
+    return next((col for col in candidates if col in df.columns), None)
 
 
 class SummaryReporter:
     """Generate summary statistics reports."""
 
+    # Metric name -> method computing it
+    METRICS = {
+        "enrollment": "get_enrollment_by_disease",
+        "recruitment": "get_annual_recruitment",
+        "encounter_summary": "get_encounter_summary",
+        "encounters_by_disease_year": "get_encounters_by_disease_year",
+        "avg_encounters": "get_avg_encounters_per_participant_disease",
+        "avg_encounters_by_year": "get_avg_encounters_per_participant_disease_year",
+    }
+
     def __init__(self, registry: str = "datahub"):
         """
         Initialize summary reporter.
@@ -32,11 +63,18 @@ class SummaryReporter:
         self.demographics = None
         self.encounter = None
         self.diagnosis = None
+        self.disease_col: Optional[str] = None
+        self.enroll_date_col: Optional[str] = None
+        self.encounter_date_col: Optional[str] = None
+        self.registry_col: Optional[str] = None
+        self.encounter_registry_col: Optional[str] = None
+        self._demographics_mask: Optional[np.ndarray] = None
+        self._encounter_mask: Optional[np.ndarray] = None
 
     def load_data(self):
         """Load required tables."""
         try:
-            self.tables = load_data()
+            self.tables = load_data(table_names=SUMMARY_TABLES)
             self.demographics = self.tables.get("demographics_maindata")
             self.encounter = self.tables.get("encounter_maindata")
             self.diagnosis = self.tables.get("diagnosis_maindata")
@@ -46,112 +84,231 @@ class SummaryReporter:
             if self.encounter is None:
                 raise ValueError("Encounter table not found")
 
+            # Resolve column names once instead of per metric
+            self.disease_col = _resolve_col(self.demographics, DISEASE_COLUMNS)
+            self.enroll_date_col = _resolve_col(self.demographics, ENROLLMENT_DATE_COLUMNS)
+            self.encounter_date_col = _resolve_col(self.encounter, ENCOUNTER_DATE_COLUMNS)
+            self.registry_col = _resolve_col(self.demographics, REGISTRY_COLUMNS)
+            self.encounter_registry_col = _resolve_col(self.encounter, REGISTRY_COLUMNS)
+
+            self._categorize_keys()
+
+            # Registry membership never changes after load, so resolve it once
+            self._demographics_mask = self._registry_mask(self.demographics, self.registry_col)
+            self._encounter_mask = self._registry_mask(self.encounter, self.encounter_registry_col)
+
+            # Drop frames derived from a previous load
+            self.__dict__.pop("_enrollment_years", None)
+            self.__dict__.pop("_encounter_years", None)
+            self.__dict__.pop("_encounter_with_disease", None)
+
             return True
         except Exception as e:
             logger.error(f"Failed to load data: {e}")
             return False
 
+    def _categorize_keys(self):
+        """
+        Convert join/group keys to categoricals sharing one code space across tables.
+
+        With a common CategoricalDtype, merges and groupbys on these columns work on
+        integer codes instead of hashing strings on every call. String categories are
+        stored as ``string[pyarrow]`` (already the default ``str`` storage on pandas 3).
+        """
+        frames = [
+            df for df in (self.demographics, self.encounter, self.diagnosis) if df is not None
+        ]
+
+        for col in ("FACPATID", self.disease_col):
+            if col is None:
+                continue
+            present = [df[col] for df in frames if col in df.columns]
+            if not present:
+                continue
+
+            # Sorted so groupby output keeps the same order as on the raw strings
+            categories = pd.Index(
+                pd.concat(present, ignore_index=True).dropna().unique()
+            ).sort_values()
+            if categories.dtype == object and pd.api.types.infer_dtype(categories) == "string":
+                # Arrow-backed categories: contiguous UTF-8 buffers instead of boxed Python strings
+                categories = categories.astype("string[pyarrow]")
+            dtype = pd.CategoricalDtype(categories=categories)
+            for df in frames:
+                if col in df.columns:
+                    df[col] = df[col].astype(dtype)
+
+    def _registry_mask(self, df: pd.DataFrame, registry_col: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Build a boolean row mask for the selected registry.
+
+        Returns None when no filtering applies (registry "all" or no registry column).
+        """
+        if self.registry not in ("datahub", "usndr") or registry_col is None:
+            return None
+
+        # Registry columns hold a handful of distinct values: classify each one once,
+        # then gather by code (the trailing entry is used for missing values, code -1)
+        codes, uniques = pd.factorize(df[registry_col])
+
+        if registry_col == "usndr":
+            # For usndr field: assume empty/null/0 = DataHub, 1/Yes = USNDR
+            is_datahub = np.array(
+                [value == 0 or value == "" for value in uniques] + [True], dtype=bool
+            )
+            flags = is_datahub if self.registry == "datahub" else ~is_datahub
+        else:
+            tags = ("MOVR", "DATAHUB") if self.registry == "datahub" else ("USNDR",)
+            flags = np.array(
+                [any(tag in str(value).upper() for tag in tags) for value in uniques] + [False],
+                dtype=bool
+            )
+
+        mask: np.ndarray = flags[codes]
+        return mask
+
     def filter_by_registry(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filter data by registry if registry column exists."""
-        # Check for actual field name first, then fallbacks
-        registry_col = None
-        for col in ["usndr", "REGISTRY", "DATA_SOURCE", "SOURCE"]:
-            if col in df.columns:
-                registry_col = col
-                break
-
-        if registry_col is None:
-            return df
+        mask: Optional[np.ndarray]
+        if df is self.demographics and self._demographics_mask is not None:
+            mask = self._demographics_mask
+        elif df is self.encounter and self._encounter_mask is not None:
+            mask = self._encounter_mask
+        else:
+            mask = self._registry_mask(df, _resolve_col(df, REGISTRY_COLUMNS))
 
-        if self.registry == "datahub":
-            # For usndr field: assume empty/null/0 = DataHub, 1/Yes = USNDR
-            if registry_col == "usndr":
-                return df[(df[registry_col].isna()) | (df[registry_col] == 0) | (df[registry_col] == "")]
-            else:
-                return df[df[registry_col].astype(str).str.upper().str.contains("MOVR|DATAHUB", na=False)]
-        elif self.registry == "usndr":
-            if registry_col == "usndr":
-                return df[(df[registry_col].notna()) & (df[registry_col] != 0) & (df[registry_col] != "")]
-            else:
-                return df[df[registry_col].astype(str).str.upper().str.contains("USNDR", na=False)]
-        else:  # all
+        if mask is None:
             return df
 
-    def get_enrollment_by_disease(self) -> Dict[str, int]:
-        """Get participant enrollment counts by disease."""
+        return df.iloc[mask]
+
+    def _attach_disease(
+        self, encounter_df: pd.DataFrame, demographics_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Left-join the demographics disease column onto encounter rows by FACPATID.
+
+        When both FACPATID columns share the categorical dtype set up in load_data and
+        demographics has one row per participant, the join is a direct code -> disease
+        lookup table; otherwise falls back to a regular merge. Both paths return the
+        merge result, including its fresh RangeIndex.
+        """
+        disease_col = self.disease_col
+        if disease_col is None:
+            # No disease column resolved: nothing to attach
+            return encounter_df
+
+        # Drop disease column from encounter if it exists (we want demographics version)
+        if disease_col in encounter_df.columns:
+            encounter_df = encounter_df.drop(columns=[disease_col])
+
+        encounter_ids = encounter_df["FACPATID"]
+        demographics_ids = demographics_df["FACPATID"]
+        disease = demographics_df[disease_col]
+
+        if (
+            isinstance(encounter_ids.dtype, pd.CategoricalDtype)
+            and encounter_ids.dtype == demographics_ids.dtype
+            and isinstance(disease.dtype, pd.CategoricalDtype)
+        ):
+            # One lookup slot per category plus a trailing slot for missing ids (code -1)
+            n_slots = len(encounter_ids.cat.categories) + 1
+            demographics_codes = demographics_ids.cat.codes.to_numpy()
+
+            if np.bincount(demographics_codes + 1, minlength=n_slots).max(initial=0) <= 1:
+                lookup = np.full(n_slots, -1, dtype=np.int64)
+                lookup[demographics_codes] = disease.cat.codes.to_numpy()
+                disease_codes = lookup[encounter_ids.cat.codes.to_numpy()]
+                return encounter_df.assign(
+                    **{disease_col: pd.Categorical.from_codes(disease_codes, dtype=disease.dtype)}
+                ).reset_index(drop=True)
+
+        return encounter_df.merge(
+            demographics_df[["FACPATID", disease_col]],
+            on="FACPATID",
+            how="left"
+        )
+
+    @cached_property
+    def _enrollment_years(self) -> pd.DataFrame:
+        """Registry-filtered demographics with ENROLLMENT_DATE/ENROLLMENT_YEAR parsed once."""
         df = self.filter_by_registry(self.demographics)
+        date_col = self.enroll_date_col
 
-        # Check for disease column (actual field name first)
-        disease_col = None
-        for col in ["dstype", "DISEASE", "DIAGNOSIS", "PRIMARY_DIAGNOSIS"]:
-            if col in df.columns:
-                disease_col = col
-                break
+        if date_col is None:
+            return df
+
+        # Suppress UserWarning about date format inference
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            enrollment_date = pd.to_datetime(df[date_col], errors="coerce")
+
+        return df.assign(
+            ENROLLMENT_DATE=enrollment_date, ENROLLMENT_YEAR=enrollment_date.dt.year
+        )
+
+    @cached_property
+    def _encounter_years(self) -> pd.DataFrame:
+        """Registry-filtered encounters with ENCOUNTER_DATE/ENCOUNTER_YEAR parsed once."""
+        df = self.filter_by_registry(self.encounter)
+        date_col = self.encounter_date_col
+
+        if date_col is None:
+            return df
+
+        # Suppress UserWarning about date format inference
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            encounter_date = pd.to_datetime(df[date_col], errors="coerce")
+
+        return df.assign(ENCOUNTER_DATE=encounter_date, ENCOUNTER_YEAR=encounter_date.dt.year)
+
+    @cached_property
+    def _encounter_with_disease(self) -> pd.DataFrame:
+        """Encounters joined with the demographics disease column, for per-disease metrics."""
+        demographics = self.filter_by_registry(self.demographics)
+        return self._attach_disease(self._encounter_years, demographics)
+
+    def get_enrollment_by_disease(self) -> pd.Series:
+        """Get participant enrollment counts by disease, indexed by disease."""
+        df = self.filter_by_registry(self.demographics)
+        disease_col = self.disease_col
 
         if disease_col is None:
-            return {}
+            return pd.Series(dtype="int64")
 
         # Count unique participants per disease
-        disease_counts = df.groupby(disease_col)["FACPATID"].nunique().to_dict()
-        return disease_counts
+        return df.groupby(disease_col, observed=True)["FACPATID"].nunique().sort_index()
 
     def get_annual_recruitment(self) -> pd.DataFrame:
         """Get annual recruitment by disease."""
-        df = self.filter_by_registry(self.demographics)
+        disease_col = self.disease_col
 
-        # Check for disease column
-        disease_col = None
-        for col in ["dstype", "DISEASE", "DIAGNOSIS"]:
-            if col in df.columns:
-                disease_col = col
-                break
-
-        # Check for enrollment date column (actual field name first)
-        date_col = None
-        for col in ["enroldt", "ENROLLMENT_DATE", "ENROLL_DATE", "CONSENT_DATE", "FIRST_VISIT_DATE"]:
-            if col in df.columns:
-                date_col = col
-                break
-
-        if disease_col is None or date_col is None:
+        if disease_col is None or self.enroll_date_col is None:
             return pd.DataFrame()
 
-        df = df.copy()
-        # Suppress UserWarning about date format inference
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            df["ENROLLMENT_DATE"] = pd.to_datetime(df[date_col], errors="coerce")
-        df["ENROLLMENT_YEAR"] = df["ENROLLMENT_DATE"].dt.year
+        df = self._enrollment_years
 
         # Count enrollments by year and disease
-        recruitment = df.groupby(["ENROLLMENT_YEAR", disease_col])["FACPATID"].nunique().reset_index()
+        recruitment = (
+            df.groupby(["ENROLLMENT_YEAR", disease_col], observed=True)["FACPATID"]
+            .nunique()
+            .reset_index()
+        )
         recruitment.columns = ["Year", "Disease", "Participants"]
+        recruitment = recruitment.astype({"Year": "int16", "Participants": "int32"})
 
         return recruitment
 
     def get_encounter_summary(self) -> Dict[str, any]:
         """Get total encounter counts overall and by year."""
-        df = self.filter_by_registry(self.encounter)
-
-        # Check for encounter date column (actual field name first)
-        date_col = None
-        for col in ["encntdt", "ENCOUNTER_DATE", "VISIT_DATE", "CASE_DATE", "DATE"]:
-            if col in df.columns:
-                date_col = col
-                break
-
-        if date_col is None:
+        if self.encounter_date_col is None:
             return {}
 
-        df = df.copy()
-        # Suppress UserWarning about date format inference
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            df["ENCOUNTER_DATE"] = pd.to_datetime(df[date_col], errors="coerce")
-        df["ENCOUNTER_YEAR"] = df["ENCOUNTER_DATE"].dt.year
+        df = self._encounter_years
 
         total_encounters = len(df)
-        encounters_by_year = df.groupby("ENCOUNTER_YEAR").size().to_dict()
+        encounters_by_year = df.groupby("ENCOUNTER_YEAR", observed=True).size().to_dict()
 
         return {
             "total": total_encounters,
@@ -160,85 +317,43 @@ class SummaryReporter:
 
     def get_encounters_by_disease_year(self) -> pd.DataFrame:
         """Get encounter counts by disease and year."""
-        # Merge demographics (for disease) with encounters
-        demographics_df = self.filter_by_registry(self.demographics)
-        encounter_df = self.filter_by_registry(self.encounter)
-
-        # Check for disease column
-        disease_col = None
-        for col in ["dstype", "DISEASE", "DIAGNOSIS"]:
-            if col in demographics_df.columns:
-                disease_col = col
-                break
-
-        if disease_col is None:
-            return pd.DataFrame()
-
-        # Drop disease column from encounter if it exists (we want demographics version)
-        encounter_cols_to_merge = encounter_df.columns.tolist()
-        if disease_col in encounter_cols_to_merge:
-            encounter_df = encounter_df.drop(columns=[disease_col])
-
-        merged = encounter_df.merge(
-            demographics_df[["FACPATID", disease_col]],
-            on="FACPATID",
-            how="left"
-        )
-
-        # Check for encounter date column
-        date_col = None
-        for col in ["encntdt", "ENCOUNTER_DATE", "VISIT_DATE", "CASE_DATE", "DATE"]:
-            if col in merged.columns:
-                date_col = col
-                break
+        disease_col = self.disease_col
 
-        if date_col is None:
+        if disease_col is None or self.encounter_date_col is None:
             return pd.DataFrame()
 
-        merged = merged.copy()
-        # Suppress UserWarning about date format inference
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            merged["ENCOUNTER_DATE"] = pd.to_datetime(merged[date_col], errors="coerce")
-        merged["ENCOUNTER_YEAR"] = merged["ENCOUNTER_DATE"].dt.year
+        merged = self._encounter_with_disease
 
         # Count encounters by disease and year
-        summary = merged.groupby([disease_col, "ENCOUNTER_YEAR"]).size().reset_index()
+        summary = (
+            merged.groupby([disease_col, "ENCOUNTER_YEAR"], observed=True).size().reset_index()
+        )
         summary.columns = ["Disease", "Year", "Encounters"]
+        summary = summary.astype({"Year": "int16", "Encounters": "int32"})
 
         return summary
 
     def get_avg_encounters_per_participant_disease(self) -> pd.DataFrame:
         """Get average encounters per participant by disease (overall)."""
-        demographics_df = self.filter_by_registry(self.demographics)
-        encounter_df = self.filter_by_registry(self.encounter)
-
-        # Check for disease column
-        disease_col = None
-        for col in ["dstype", "DISEASE", "DIAGNOSIS"]:
-            if col in demographics_df.columns:
-                disease_col = col
-                break
+        disease_col = self.disease_col
 
         if disease_col is None:
             return pd.DataFrame()
 
-        # Drop disease column from encounter if it exists (we want demographics version)
-        if disease_col in encounter_df.columns:
-            encounter_df = encounter_df.drop(columns=[disease_col])
-
-        merged = encounter_df.merge(
-            demographics_df[["FACPATID", disease_col]],
-            on="FACPATID",
-            how="left"
-        )
+        merged = self._encounter_with_disease
 
         # Count encounters per participant
-        encounters_per_patient = merged.groupby(["FACPATID", disease_col]).size().reset_index()
+        encounters_per_patient = (
+            merged.groupby(["FACPATID", disease_col], observed=True).size().reset_index()
+        )
         encounters_per_patient.columns = ["FACPATID", "Disease", "Encounters"]
 
         # Average by disease
-        avg_by_disease = encounters_per_patient.groupby("Disease")["Encounters"].mean().reset_index()
+        avg_by_disease = (
+            encounters_per_patient.groupby("Disease", observed=True)["Encounters"]
+            .mean()
+            .reset_index()
+        )
         avg_by_disease.columns = ["Disease", "Avg Encounters/Participant"]
         avg_by_disease["Avg Encounters/Participant"] = avg_by_disease["Avg Encounters/Participant"].round(2)
 
@@ -246,56 +361,75 @@ class SummaryReporter:
 
     def get_avg_encounters_per_participant_disease_year(self) -> pd.DataFrame:
         """Get average encounters per participant by disease and year."""
-        demographics_df = self.filter_by_registry(self.demographics)
-        encounter_df = self.filter_by_registry(self.encounter)
-
-        # Check for disease column
-        disease_col = None
-        for col in ["dstype", "DISEASE", "DIAGNOSIS"]:
-            if col in demographics_df.columns:
-                disease_col = col
-                break
+        disease_col = self.disease_col
 
-        if disease_col is None:
+        if disease_col is None or self.encounter_date_col is None:
             return pd.DataFrame()
 
-        # Drop disease column from encounter if it exists (we want demographics version)
-        if disease_col in encounter_df.columns:
-            encounter_df = encounter_df.drop(columns=[disease_col])
+        merged = self._encounter_with_disease
 
-        merged = encounter_df.merge(
-            demographics_df[["FACPATID", disease_col]],
-            on="FACPATID",
-            how="left"
-        )
+        # The mean of per-participant counts is encounters / distinct participants per
+        # (disease, year) cell, so count both directly instead of building the
+        # per-participant intermediate. Rows with a missing key are dropped, as groupby would.
+        disease_codes, diseases = pd.factorize(merged[disease_col], sort=True)
+        year_codes, years = pd.factorize(merged["ENCOUNTER_YEAR"], sort=True)
+        patient_codes, _ = pd.factorize(merged["FACPATID"])
+        valid = (disease_codes >= 0) & (year_codes >= 0) & (patient_codes >= 0)
 
-        # Check for encounter date column
-        date_col = None
-        for col in ["encntdt", "ENCOUNTER_DATE", "VISIT_DATE", "CASE_DATE", "DATE"]:
-            if col in merged.columns:
-                date_col = col
-                break
+        n_years = max(len(years), 1)
+        n_cells = len(diseases) * n_years
+        cells = disease_codes[valid].astype(np.int64) * n_years + year_codes[valid]
 
-        if date_col is None:
-            return pd.DataFrame()
+        encounters = np.bincount(cells, minlength=n_cells)
+        participant_cells = np.unique((cells << 32) | patient_codes[valid]) >> 32
+        participants = np.bincount(participant_cells, minlength=n_cells)
 
-        merged = merged.copy()
-        # Suppress UserWarning about date format inference
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UserWarning)
-            merged["ENCOUNTER_DATE"] = pd.to_datetime(merged[date_col], errors="coerce")
-        merged["ENCOUNTER_YEAR"] = merged["ENCOUNTER_DATE"].dt.year
+        observed = np.flatnonzero(participants)
+        disease_idx, year_idx = np.divmod(observed, n_years)
+        avg_by_disease_year = pd.DataFrame({
+            "Disease": diseases.take(disease_idx),
+            "Year": years.take(year_idx).astype("int16"),
+            "Avg Encounters/Participant": (encounters[observed] / participants[observed]).round(2),
+        })
 
-        # Count encounters per participant per year
-        encounters_per_patient_year = merged.groupby(["FACPATID", disease_col, "ENCOUNTER_YEAR"]).size().reset_index()
-        encounters_per_patient_year.columns = ["FACPATID", "Disease", "Year", "Encounters"]
+        return avg_by_disease_year
 
-        # Average by disease and year
-        avg_by_disease_year = encounters_per_patient_year.groupby(["Disease", "Year"])["Encounters"].mean().reset_index()
-        avg_by_disease_year.columns = ["Disease", "Year", "Avg Encounters/Participant"]
-        avg_by_disease_year["Avg Encounters/Participant"] = avg_by_disease_year["Avg Encounters/Participant"].round(2)
+    def compute_metrics(self, names: List[str], max_workers: int = 4) -> Dict[str, Any]:
+        """
+        Compute several metrics, running them in parallel threads.
 
-        return avg_by_disease_year
+        pandas releases the GIL inside its groupby/merge kernels, so independent
+        metrics overlap. The shared frames are built before dispatch (see
+        ``_prepare_shared``) so the worker threads only read them.
+
+        Args:
+            names: Metric names (keys of METRICS)
+            max_workers: Maximum number of worker threads
+
+        Returns:
+            Dict mapping metric names to results
+        """
+        methods = {name: getattr(self, self.METRICS[name]) for name in names}
+
+        if len(methods) <= 1:
+            return {name: method() for name, method in methods.items()}
+
+        self._prepare_shared()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(methods))) as executor:
+            futures = {name: executor.submit(method) for name, method in methods.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _prepare_shared(self) -> None:
+        """
+        Build the cached frames the metrics share, on the caller's thread.
+
+        Their date parsing runs under ``warnings.catch_warnings()``, which swaps
+        process-global warning state and is not thread-safe, so it must not happen
+        inside the worker pool.
+        """
+        for name in ("_enrollment_years", "_encounter_years", "_encounter_with_disease"):
+            getattr(self, name)
 
 
 def run_summary(registry: str = "datahub", metric: str = "all"):
@@ -306,6 +440,11 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
         registry: Which registry (datahub, usndr, all)
         metric: Which metric to show (enrollment, recruitment, encounters, rates, all)
     """
+    # Rich is only needed for rendering, so keep it out of module import
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
     console.print(f"\n[bold blue]MOVR Summary Statistics[/bold blue]")
 
     registry_name = {
@@ -326,20 +465,28 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
         console.print("[red]Failed to load data. Run 'movr convert' first.[/red]")
         return
 
+    # Compute everything up front (in parallel), then render sequentially
+    # since Rich isn't thread-safe
+    results = reporter.compute_metrics([
+        name
+        for group, names in METRIC_GROUPS.items()
+        if metric in (group, "all")
+        for name in names
+    ])
+
     # Show enrollment by disease
     if metric in ["enrollment", "all"]:
         console.print("\n[bold] Enrollment by Disease[/bold]")
-        enrollment = reporter.get_enrollment_by_disease()
+        enrollment = results["enrollment"]
 
-        if enrollment:
+        if not enrollment.empty:
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Disease", style="cyan")
             table.add_column("Participants", justify="right", style="green")
 
-            total = 0
-            for disease, count in sorted(enrollment.items()):
+            for disease, count in zip(enrollment.index.to_numpy(), enrollment.to_numpy()):
                 table.add_row(disease, f"{count:,}")
-                total += count
+            total = int(enrollment.sum())
 
             table.add_row("", "", style="dim")
             table.add_row("[bold]TOTAL[/bold]", f"[bold]{total:,}[/bold]")
@@ -351,21 +498,22 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
     # Show annual recruitment
     if metric in ["recruitment", "all"]:
         console.print("\n[bold] Annual Recruitment by Disease[/bold]")
-        recruitment = reporter.get_annual_recruitment()
+        recruitment = results["recruitment"]
 
         if not recruitment.empty:
             # Pivot for better display
-            pivot = recruitment.pivot(index="Disease", columns="Year", values="Participants").fillna(0).astype(int)
+            # unstack(fill_value=0) keeps the int32 counts instead of going through float64
+            pivot = recruitment.set_index(["Disease", "Year"])["Participants"].unstack(fill_value=0)
 
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Disease", style="cyan")
 
-            for year in sorted(pivot.columns):
+            years = sorted(pivot.columns)
+            for year in years:
                 table.add_column(str(int(year)), justify="right")
 
-            for disease in pivot.index:
-                row_data = [disease] + [f"{int(pivot.loc[disease, year]):,}" for year in sorted(pivot.columns)]
-                table.add_row(*row_data)
+            for disease, counts in zip(pivot.index, pivot[years].to_numpy()):
+                table.add_row(disease, *[f"{int(count):,}" for count in counts])
 
             console.print(table)
         else:
@@ -374,7 +522,7 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
     # Show encounter summary
     if metric in ["encounters", "all"]:
         console.print("\n[bold] Encounter Summary[/bold]")
-        encounter_summary = reporter.get_encounter_summary()
+        encounter_summary = results["encounter_summary"]
 
         if encounter_summary:
             console.print(f"[cyan]Total Encounters:[/cyan] {encounter_summary.get('total', 0):,}")
@@ -393,21 +541,23 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
 
         # Encounters by disease and year
         console.print("\n[dim]Encounters by Disease and Year:[/dim]")
-        encounters_by_disease = reporter.get_encounters_by_disease_year()
+        encounters_by_disease = results["encounters_by_disease_year"]
 
         if not encounters_by_disease.empty:
-            pivot = encounters_by_disease.pivot(index="Disease", columns="Year", values="Encounters").fillna(0).astype(int)
+            pivot = (
+                encounters_by_disease.set_index(["Disease", "Year"])["Encounters"]
+                .unstack(fill_value=0)
+            )
 
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Disease", style="cyan")
 
-            for year in sorted(pivot.columns):
-                if pd.notna(year):
-                    table.add_column(str(int(year)), justify="right")
+            years = sorted(pivot.columns)
+            for year in years:
+                table.add_column(str(int(year)), justify="right")
 
-            for disease in pivot.index:
-                row_data = [disease] + [f"{int(pivot.loc[disease, year]):,}" for year in sorted(pivot.columns) if pd.notna(year)]
-                table.add_row(*row_data)
+            for disease, counts in zip(pivot.index, pivot[years].to_numpy()):
+                table.add_row(disease, *[f"{int(count):,}" for count in counts])
 
             console.print(table)
         else:
@@ -416,15 +566,18 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
     # Show average encounters per participant
     if metric in ["rates", "all"]:
         console.print("\n[bold] Average Encounters per Participant by Disease[/bold]")
-        avg_encounters = reporter.get_avg_encounters_per_participant_disease()
+        avg_encounters = results["avg_encounters"]
 
         if not avg_encounters.empty:
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Disease", style="cyan")
             table.add_column("Avg Encounters/Participant", justify="right", style="green")
 
-            for _, row in avg_encounters.iterrows():
-                table.add_row(row["Disease"], f"{row['Avg Encounters/Participant']:.2f}")
+            for disease, avg in zip(
+                avg_encounters["Disease"].to_numpy(),
+                avg_encounters["Avg Encounters/Participant"].to_numpy()
+            ):
+                table.add_row(disease, f"{avg:.2f}")
 
             console.print(table)
         else:
@@ -432,21 +585,23 @@ def run_summary(registry: str = "datahub", metric: str = "all"):
 
         # By year
         console.print("\n[dim]Average Encounters per Participant by Disease and Year:[/dim]")
-        avg_by_year = reporter.get_avg_encounters_per_participant_disease_year()
+        avg_by_year = results["avg_encounters_by_year"]
 
         if not avg_by_year.empty:
-            pivot = avg_by_year.pivot(index="Disease", columns="Year", values="Avg Encounters/Participant").fillna(0)
+            pivot = (
+                avg_by_year.set_index(["Disease", "Year"])["Avg Encounters/Participant"]
+                .unstack(fill_value=0)
+            )
 
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Disease", style="cyan")
 
-            for year in sorted(pivot.columns):
-                if pd.notna(year):
-                    table.add_column(str(int(year)), justify="right")
+            years = sorted(pivot.columns)
+            for year in years:
+                table.add_column(str(int(year)), justify="right")
 
-            for disease in pivot.index:
-                row_data = [disease] + [f"{pivot.loc[disease, year]:.2f}" for year in sorted(pivot.columns) if pd.notna(year)]
-                table.add_row(*row_data)
+            for disease, avgs in zip(pivot.index, pivot[years].to_numpy()):
+                table.add_row(disease, *[f"{avg:.2f}" for avg in avgs])
 
             console.print(table)
         else:
@@ -5,12 +5,20 @@ Provides movr command-line tool.
 """
 
 import click
-from loguru import logger
-import sys
 
-# Configure loguru
-logger.remove()
-logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>")
+
+def _configure_logging():
+    """Route loguru output to stderr; only called by commands that load data or log."""
+    import sys
+    from loguru import logger
+
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        format=(
+            "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+        ),
+    )
 
 
 @click.group()
@@ -25,6 +33,7 @@ def cli():
 @click.option('--config', type=click.Path(), help='Path to config file')
 def setup(source_dir, config):
     """Interactive setup wizard for first-time configuration."""
+    _configure_logging()
     from movr.cli.commands.setup import run_setup
     run_setup(source_dir=source_dir, config_path=config)
 
@@ -36,6 +45,7 @@ def setup(source_dir, config):
 @click.option('--clean', is_flag=True, help='Remove all existing Parquet files before conversion')
 def convert(source_dir, config, force, clean):
     """Convert Excel files to Parquet format."""
+    _configure_logging()
     from movr.cli.commands.convert import run_convert
     run_convert(source_dir=source_dir, config_path=config, force=force, clean=clean)
 
@@ -44,6 +54,7 @@ def convert(source_dir, config, force, clean):
 @click.option('--strictness', type=click.Choice(['strict', 'permissive', 'interactive']), default='permissive')
 def validate(strictness):
     """Validate data quality and enrollment."""
+    _configure_logging()
     from movr.cli.commands.validate import run_validate
     run_validate(strictness=strictness)
 
@@ -104,6 +115,7 @@ def browse_fields(table_name):
 @cli.command()
 def status():
     """Check data and configuration status."""
+    _configure_logging()
     from movr.cli.commands.status import run_status
     run_status()
 
@@ -115,6 +127,7 @@ def status():
               default='all', help='Which metrics to display')
 def summary(registry, metric):
     """Display summary statistics (enrollment, encounters, rates)."""
+    _configure_logging()
     from movr.cli.commands.summary import run_summary
     run_summary(registry=registry, metric=metric)
 
@@ -127,6 +140,7 @@ def import_dictionary_cmd(excel_path, output):
 
     If no path provided, auto-detects dictionary file in ../source-movr-data/
     """
+    _configure_logging()
     from movr.cli.commands.dictionary import run_import_dictionary
     run_import_dictionary(excel_path, output)
 
@@ -150,6 +164,7 @@ def search_dictionary(keyword, diseases, form):
         movr dictionary search "ambulation" --diseases "all"
         movr dictionary search "vital" --form "Encounter"
     """
+    _configure_logging()
     from movr.cli.commands.dictionary import run_search_dictionary
     run_search_dictionary(keyword, diseases, form)
 
@@ -158,6 +173,7 @@ def search_dictionary(keyword, diseases, form):
 @click.option('--table', help='Filter by table name')
 def list_dictionary_fields(table):
     """List all fields in data dictionary."""
+    _configure_logging()
     from movr.cli.commands.dictionary import run_list_fields
     run_list_fields(table)
 
@@ -166,6 +182,7 @@ def list_dictionary_fields(table):
 @click.argument('field_name')
 def show_dictionary_field(field_name):
     """Show detailed information about a specific field."""
+    _configure_logging()
     from movr.cli.commands.dictionary import run_show_field
     run_show_field(field_name)
 
@@ -2,12 +2,21 @@
 Filter expressions for cohort building.
 
 Provides a simple DSL for building complex filters.
+
+Comparison filters compile to a pandas expression string, so chains built with
+``&`` / ``|`` are evaluated in a single ``DataFrame.eval`` call (numexpr is used
+automatically when installed) instead of one boolean pass per condition.
 """
 
-from typing import Any, Callable
+from itertools import count
+from typing import Any, Callable, Dict, Optional
 import pandas as pd
 
 
+# Unique names for values bound into compiled expressions
+_PARAM_IDS = count()
+
+
 class FilterExpression:
     """Build filter expressions for cohort filtering."""
 
@@ -19,41 +28,72 @@ class FilterExpression:
             column: Column name to filter on
         """
         self.column = column
-        self._condition: Callable = None
+        self._condition: Optional[Callable] = None
+        self._expr: Optional[str] = None
+        self._params: Dict[str, Any] = {}
+
+    def _set_expr(self, template: str, *values: Any) -> 'FilterExpression':
+        """Compile a condition from a template using {col} and {0}, {1}, ... placeholders."""
+        names = [f"_p{next(_PARAM_IDS)}" for _ in values]
+        self._expr = template.format(*[f"@{name}" for name in names], col=f"`{self.column}`")
+        self._params = dict(zip(names, values))
+        self._condition = None
+        return self
 
     def equals(self, value: Any) -> 'FilterExpression':
         """Filter where column equals value."""
-        self._condition = lambda df: df[self.column] == value
-        return self
+        return self._set_expr("{col} == {0}", value)
 
     def in_list(self, values: list) -> 'FilterExpression':
         """Filter where column is in list of values."""
-        self._condition = lambda df: df[self.column].isin(values)
-        return self
+        return self._set_expr("{col} in {0}", list(values))
 
     def between(self, min_val: Any, max_val: Any) -> 'FilterExpression':
         """Filter where column is between min and max (inclusive)."""
-        self._condition = lambda df: (df[self.column] >= min_val) & (df[self.column] <= max_val)
-        return self
+        return self._set_expr("({col} >= {0}) & ({col} <= {1})", min_val, max_val)
 
     def greater_than(self, value: Any) -> 'FilterExpression':
         """Filter where column is greater than value."""
-        self._condition = lambda df: df[self.column] > value
-        return self
+        return self._set_expr("{col} > {0}", value)
 
     def less_than(self, value: Any) -> 'FilterExpression':
         """Filter where column is less than value."""
-        self._condition = lambda df: df[self.column] < value
-        return self
+        return self._set_expr("{col} < {0}", value)
 
     def contains(self, substring: str, case_sensitive: bool = False) -> 'FilterExpression':
         """Filter where column contains substring."""
+        # String matching can't be expressed in eval; keep a single vectorized str.contains
+        self._expr = None
+        self._params = {}
         if case_sensitive:
             self._condition = lambda df: df[self.column].str.contains(substring, na=False)
         else:
             self._condition = lambda df: df[self.column].str.contains(substring, case=False, na=False)
         return self
 
+    def _combine(self, other: 'FilterExpression', op: str) -> 'FilterExpression':
+        """Combine two expressions, fusing them into one eval string when possible."""
+        if not isinstance(other, FilterExpression):
+            return NotImplemented
+
+        combined = FilterExpression(self.column)
+        if self._expr is not None and other._expr is not None:
+            combined._expr = f"({self._expr}) {op} ({other._expr})"
+            combined._params = {**self._params, **other._params}
+        elif op == "&":
+            combined._condition = lambda df: self.apply(df) & other.apply(df)
+        else:
+            combined._condition = lambda df: self.apply(df) | other.apply(df)
+        return combined
+
+    def __and__(self, other: 'FilterExpression') -> 'FilterExpression':
+        """Match rows satisfying both expressions."""
+        return self._combine(other, "&")
+
+    def __or__(self, other: 'FilterExpression') -> 'FilterExpression':
+        """Match rows satisfying either expression."""
+        return self._combine(other, "|")
+
     def apply(self, df: pd.DataFrame) -> pd.Series:
         """
         Apply filter expression to DataFrame.
@@ -64,6 +104,8 @@ class FilterExpression:
         Returns:
             Boolean Series indicating which rows match
         """
+        if self._expr is not None:
+            return df.eval(self._expr, local_dict=self._params)
         if self._condition is None:
             raise ValueError("No filter condition defined")
         return self._condition(df)
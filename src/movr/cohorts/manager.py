@@ -4,31 +4,80 @@ Cohort management system.
 Provides cohort creation, filtering, and validation with field resolution.
 """
 
+import numbers
+import numpy as np
 import pandas as pd
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Callable, Any, List, Union
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Callable, Any, List, Tuple, Union
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from movr.cohorts.validation import EnrollmentValidator
-from movr.config import get_config
+
+# Default field mappings (used if config not available)
+_DEFAULT_MAPPINGS: Mapping[str, Optional[str]] = MappingProxyType({
+    "disease": "dstype",
+    "registry": "usndr",
+    "gender": "gender",
+    "birth_date": "dob",
+    "age": None,  # Derived field
+    "patient_id": "FACPATID",
+    "enrollment_date": "enroldt",
+    "encounter_date": "encntdt",
+})
+
+# Alternative column names tried (exact match) when nothing else resolves
+_FALLBACKS: Mapping[str, tuple] = MappingProxyType({
+    "disease": ("dstype", "DISEASE", "DIAGNOSIS"),
+    "registry": ("usndr", "REGISTRY", "DATA_SOURCE"),
+    "gender": ("gender", "sex", "GENDER", "SEX"),
+    "age": ("AGE", "age", "AGE_YEARS"),
+})
+
+# field_mappings.yaml in the project's config/ directory
+_DEFAULT_FIELD_MAPPINGS_PATH = (
+    Path(__file__).resolve().parents[3] / "config" / "field_mappings.yaml"
+)
+
+
+@lru_cache(maxsize=8)
+def _load_field_mappings(path: Path, mtime_ns: int) -> Mapping[str, Optional[str]]:
+    """
+    Parse field_mappings.yaml into canonical name -> source column.
+
+    Cached per path and modification time, so creating another FieldResolver
+    (one per CohortManager) doesn't re-parse the file. The result is read-only
+    since it is shared between resolvers.
+    """
+    mappings = {}
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+        if data and "fields" in data:
+            for canonical, info in data["fields"].items():
+                if isinstance(info, dict):
+                    mappings[canonical] = info.get("source_field")
+                elif isinstance(info, list):
+                    mappings[canonical] = info[0] if info else None
+
+    return MappingProxyType(mappings)
 
 
 class FieldResolver:
     """Resolve canonical field names to actual column names."""
 
-    # Default field mappings (used if config not available)
-    DEFAULT_MAPPINGS = {
-        "disease": "dstype",
-        "registry": "usndr",
-        "gender": "gender",
-        "birth_date": "dob",
-        "age": None,  # Derived field
-        "patient_id": "FACPATID",
-        "enrollment_date": "enroldt",
-        "encounter_date": "encntdt",
-    }
+    # Read-only views of the module-level defaults
+    DEFAULT_MAPPINGS = _DEFAULT_MAPPINGS
+    FALLBACKS = _FALLBACKS
 
     def __init__(self, field_mappings_path: Optional[Path] = None):
         """
@@ -37,30 +86,27 @@ class FieldResolver:
         Args:
             field_mappings_path: Path to field_mappings.yaml
         """
-        self._mappings = {}
+        self._mappings: Mapping[str, Optional[str]] = {}
+        # id(columns) -> (columns, lowercase name -> first matching column)
+        self._lower_columns: Dict[int, Tuple[pd.Index, Dict[str, str]]] = {}
         self._load_mappings(field_mappings_path)
 
+        # Loaded mappings override defaults; empty entries fall back to the default
+        self._effective: Dict[str, Optional[str]] = {
+            **_DEFAULT_MAPPINGS,
+            **{canonical: source for canonical, source in self._mappings.items() if source},
+        }
+
     def _load_mappings(self, path: Optional[Path] = None):
         """Load field mappings from YAML file."""
         if path is None:
-            # Try to find field_mappings.yaml
-            try:
-                config = get_config()
-                # Look relative to config location
-                config_dir = Path(__file__).parent.parent.parent.parent / "config"
-                path = config_dir / "field_mappings.yaml"
-            except Exception:
+            # Project config directory, else relative to the working directory
+            path = _DEFAULT_FIELD_MAPPINGS_PATH
+            if not path.exists():
                 path = Path("config/field_mappings.yaml")
 
         if path and path.exists():
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
-                if data and "fields" in data:
-                    for canonical, info in data["fields"].items():
-                        if isinstance(info, dict):
-                            self._mappings[canonical] = info.get("source_field")
-                        elif isinstance(info, list):
-                            self._mappings[canonical] = info[0] if info else None
+            self._mappings = _load_field_mappings(path, path.stat().st_mtime_ns)
             logger.debug(f"Loaded field mappings from: {path}")
         else:
             logger.debug("Using default field mappings")
@@ -77,30 +123,40 @@ class FieldResolver:
             Actual column name if found, None otherwise
         """
         # Check explicit mapping first
-        mapped = self._mappings.get(canonical_name) or self.DEFAULT_MAPPINGS.get(canonical_name)
+        mapped = self._effective.get(canonical_name)
 
         if mapped and mapped in df.columns:
             return mapped
 
         # Try canonical name directly (case variations)
-        for col in df.columns:
-            if col.lower() == canonical_name.lower():
-                return col
+        col = self._lowercase_lookup(df.columns).get(canonical_name.lower())
+        if col is not None:
+            return col
 
         # Try fallbacks from default mappings
-        fallbacks = {
-            "disease": ["dstype", "DISEASE", "DIAGNOSIS"],
-            "registry": ["usndr", "REGISTRY", "DATA_SOURCE"],
-            "gender": ["gender", "sex", "GENDER", "SEX"],
-            "age": ["AGE", "age", "AGE_YEARS"],
-        }
-
-        for fallback in fallbacks.get(canonical_name, []):
+        for fallback in _FALLBACKS.get(canonical_name, ()):
             if fallback in df.columns:
                 return fallback
 
         return None
 
+    def _lowercase_lookup(self, columns: pd.Index) -> Dict[str, str]:
+        """Get a lowercase -> column name dict for these columns, built once per Index."""
+        cached = self._lower_columns.get(id(columns))
+        # The entry keeps the Index alive, so a matching id is the same object
+        if cached is not None and cached[0] is columns:
+            return cached[1]
+
+        lookup: Dict[str, str] = {}
+        for col in columns:
+            if isinstance(col, str):
+                lookup.setdefault(col.lower(), col)
+
+        if len(self._lower_columns) >= 32:
+            self._lower_columns.clear()
+        self._lower_columns[id(columns)] = (columns, lookup)
+        return lookup
+
     def is_derived(self, canonical_name: str) -> bool:
         """Check if field is derived (needs calculation)."""
         return canonical_name == "age"
@@ -116,41 +172,131 @@ class CohortManager:
         Args:
             tables: Dict mapping table names to DataFrames
         """
-        self.tables = tables
-        self._cohorts: Dict[str, pd.DataFrame] = {}
-        self.validator = EnrollmentValidator(tables)
+        self._facpatid_dtype: Optional[pd.CategoricalDtype] = None
+        # Id dtype of the source tables, restored on every frame handed back to callers
+        self._facpatid_source_dtype: Any = None
+        self.tables = dict(tables)
+        # Same tables with FACPATID as shared categorical codes, for internal use only
+        self._coded_tables = self._unify_facpatid_categorical(tables)
+        # Cohort name -> FACPATID Index; DataFrames are built only at the API boundary
+        self._cohorts: Dict[str, pd.Index] = {}
+        self.validator = EnrollmentValidator(self._coded_tables)
         self.field_resolver = FieldResolver()
+        # (id(frame), column) -> (frame, registry masks); see _registry_flags
+        self._registry_cache: Dict[
+            Tuple[int, str], Tuple[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]
+        ] = {}
+        # table name -> (table, rows grouped by FACPATID code, group offsets); see _facpatid_rows
+        self._facpatid_row_index: Dict[str, tuple] = {}
 
         # Pre-calculate age if dob is available
         self._demographics_with_age = None
         self._prepare_demographics()
 
+    def _unify_facpatid_categorical(
+        self, tables: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Convert FACPATID to one CategoricalDtype shared by all tables.
+
+        Enrollment intersection, cohort merges and table filtering then compare
+        integer codes instead of hashing string ids. String ids are stored as
+        ``string[pyarrow]`` categories (the default ``str`` storage on pandas 3).
+        Tables are shallow-copied so the caller's DataFrames are left untouched.
+
+        The codes never leave the manager: the categories are every id in the
+        registry, so on returned frames they would inflate ``value_counts()`` and
+        ``groupby(observed=False)``. See ``_restore_ids``.
+        """
+        present = [df["FACPATID"] for df in tables.values() if "FACPATID" in df.columns]
+        if not present:
+            return dict(tables)
+
+        ids = pd.concat(present, ignore_index=True)
+        self._facpatid_source_dtype = ids.dtype
+        categories = pd.Index(ids.dropna().unique())
+        try:
+            categories = categories.sort_values()
+        except TypeError:
+            # Mixed id types can't be ordered; keep first-seen order
+            pass
+        if categories.dtype == object and pd.api.types.infer_dtype(categories) == "string":
+            # Arrow-backed categories: contiguous UTF-8 buffers instead of boxed Python strings
+            categories = categories.astype("string[pyarrow]")
+        self._facpatid_dtype = pd.CategoricalDtype(categories=categories)
+
+        unified = {}
+        for table_name, df in tables.items():
+            if "FACPATID" in df.columns:
+                df = df.copy(deep=False)
+                df["FACPATID"] = df["FACPATID"].astype(self._facpatid_dtype)
+            unified[table_name] = df
+        return unified
+
+    def _encode_ids(self, ids: Any) -> pd.Index:
+        """Convert FACPATIDs to an Index of the shared categorical codes."""
+        return pd.Index(pd.Categorical(ids, dtype=self._facpatid_dtype), name="FACPATID")
+
+    def _restore_ids(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast a frame's FACPATID codes back to the id dtype of the source tables."""
+        if (
+            self._facpatid_dtype is None
+            or "FACPATID" not in df.columns
+            or df["FACPATID"].dtype != self._facpatid_dtype
+        ):
+            return df
+        df = df.copy(deep=False)
+        df["FACPATID"] = df["FACPATID"].astype(self._facpatid_source_dtype)
+        return df
+
     def _prepare_demographics(self):
         """Prepare demographics table with derived fields like age."""
-        if "demographics_maindata" not in self.tables:
+        if "demographics_maindata" not in self._coded_tables:
             return
 
-        df = self.tables["demographics_maindata"].copy()
+        df = self._coded_tables["demographics_maindata"]
 
         # Calculate age from dob if not present
         dob_col = self.field_resolver.resolve("birth_date", df)
         if dob_col and "AGE" not in df.columns:
             try:
                 # Convert dob to datetime
-                df[dob_col] = pd.to_datetime(df[dob_col], errors='coerce')
-                today = datetime.now()
-                df["AGE"] = ((today - df[dob_col]).dt.days / 365.25).round(1)
+                dob = pd.to_datetime(df[dob_col], errors='coerce')
+                age = self._age_in_years(dob, datetime.now())
+                # Shallow copy: shares the other columns with the source table
+                df = df.copy(deep=False)
+                df[dob_col] = dob
+                df["AGE"] = age
                 logger.debug(f"Calculated AGE from {dob_col}")
             except Exception as e:
                 logger.warning(f"Could not calculate age from {dob_col}: {e}")
 
         self._demographics_with_age = df
 
+    @staticmethod
+    def _age_in_years(dob: pd.Series, today: datetime) -> np.ndarray:
+        """
+        Age in years (1 decimal) from a datetime Series.
+
+        Works on the raw int64 ticks rather than building a timedelta Series and
+        going through ``.dt.days``. Days are floored like ``.dt.days``; NaT gives NaN.
+        """
+        # numpy's stubs only accept literal unit strings
+        unit: Any = np.datetime_data(dob.dtype)[0]
+        ticks_per_day = np.timedelta64(1, "D") // np.timedelta64(1, unit)
+        today_ticks = np.datetime64(today, unit).astype(np.int64)
+
+        valid = dob.notna().to_numpy()
+        dob_ticks = np.where(valid, dob.to_numpy().view(np.int64), today_ticks)
+        days = (today_ticks - dob_ticks) // ticks_per_day
+
+        return np.where(valid, np.round(days / 365.25, 1), np.nan)
+
     def _get_demographics(self) -> pd.DataFrame:
         """Get demographics table with derived fields."""
         if self._demographics_with_age is not None:
             return self._demographics_with_age
-        return self.tables.get("demographics_maindata", pd.DataFrame())
+        return self._coded_tables.get("demographics_maindata", pd.DataFrame())
 
     def _resolve_filter_field(self, field: str, df: pd.DataFrame) -> Optional[str]:
         """Resolve a filter field name to actual column."""
@@ -165,28 +311,127 @@ class CohortManager:
 
         return None
 
-    def _apply_registry_filter(self, df: pd.DataFrame, value: Any) -> pd.DataFrame:
+    def _resolve_filters(self, filters: Dict[str, Any], df: pd.DataFrame) -> List[tuple]:
         """
-        Apply registry (USNDR/DataHub) filter.
+        Resolve filter fields to actual columns.
 
         Args:
-            df: DataFrame to filter
-            value: True for USNDR, False for DataHub
+            filters: Field-based filters (see filter_cohort)
+            df: DataFrame the filters will be applied to
 
         Returns:
-            Filtered DataFrame
+            List of (field, column, value) tuples; unknown fields are skipped with a warning
         """
-        registry_col = self._resolve_filter_field("registry", df)
-        if not registry_col:
-            logger.warning("Registry field not found for filtering")
-            return df
+        resolved = []
 
-        if value is True or value == "usndr" or value == "USNDR":
-            # USNDR: usndr == True
-            return df[df[registry_col] == True]
-        else:
-            # DataHub: usndr is not True (None, NA, missing, False, etc.)
-            return df[df[registry_col] != True]
+        for field, value in filters.items():
+            if field == "registry":
+                registry_col = self._resolve_filter_field("registry", df)
+                if not registry_col:
+                    logger.warning("Registry field not found for filtering")
+                    continue
+                resolved.append((field, registry_col, value))
+                continue
+
+            actual_field = self._resolve_filter_field(field, df)
+            if not actual_field:
+                logger.warning(f"Filter field not found: {field}")
+                continue
+            resolved.append((field, actual_field, value))
+
+        return resolved
+
+    def _registry_flags(
+        self, df: pd.DataFrame, column: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get (usndr == True, usndr != True) row masks for a registry column.
+
+        The column holds a handful of distinct values, so each one is compared once
+        and the result gathered by code. Masks are cached per frame, since the same
+        demographics table is filtered for every cohort.
+        """
+        key = (id(df), column)
+        cached = self._registry_cache.get(key)
+        # The entry keeps the frame alive, so a matching id is the same object
+        if cached is not None and cached[0] is df:
+            return cached[1]
+
+        values = df[column]
+        codes, uniques = pd.factorize(values)
+        # Trailing slot for missing values (code -1), compared in the column's own dtype
+        lookup = pd.concat(
+            [pd.Series(uniques, dtype=values.dtype), pd.Series([None], dtype=values.dtype)],
+            ignore_index=True,
+        )
+        flags = (
+            (lookup == True).to_numpy(dtype=bool, na_value=False)[codes],
+            (lookup != True).to_numpy(dtype=bool, na_value=False)[codes],
+        )
+
+        if len(self._registry_cache) >= 8:
+            self._registry_cache.clear()
+        self._registry_cache[key] = (df, flags)
+        return flags
+
+    def _filter_mask(self, df: pd.DataFrame, resolved: List[tuple]) -> np.ndarray:
+        """
+        Combine resolved filters into a single boolean row mask.
+
+        Comparisons of plain numeric columns against real/bool scalars run as
+        numpy ufuncs on the raw array, writing into one scratch buffer that is
+        AND-ed into the mask, so a chain of predicates allocates no per-condition
+        Series. Other dtypes and operands (strings, None, ...) use the pandas
+        comparison; missing results (nullable dtypes) count as False, as they do
+        when indexing with the condition directly.
+        """
+        mask = np.ones(len(df), dtype=bool)
+        scratch = None
+
+        for field, column, value in resolved:
+            values = df[column]
+
+            # (ufunc, operand) pairs; ufunc None means membership in a list
+            if field == "registry":
+                is_usndr, not_usndr = self._registry_flags(df, column)
+                if value is True or value == "usndr" or value == "USNDR":
+                    # USNDR: usndr == True
+                    mask &= is_usndr
+                else:
+                    # DataHub: usndr is not True (None, NA, missing, False, etc.)
+                    mask &= not_usndr
+                continue
+            elif isinstance(value, dict):
+                # Range filter: {"min": X, "max": Y}
+                conditions: List[Tuple[Optional[np.ufunc], Any]] = []
+                if "min" in value:
+                    conditions.append((np.greater_equal, value["min"]))
+                if "max" in value:
+                    conditions.append((np.less_equal, value["max"]))
+            elif isinstance(value, tuple) and len(value) == 2:
+                # Legacy range filter: (min, max)
+                conditions = [(np.greater_equal, value[0]), (np.less_equal, value[1])]
+            elif isinstance(value, list):
+                # Multiple values
+                conditions = [(None, value)]
+            else:
+                # Exact match
+                conditions = [(np.equal, value)]
+
+            numeric = isinstance(values.dtype, np.dtype) and values.dtype.kind in "iufb"
+            for ufunc, operand in conditions:
+                scalar = isinstance(operand, (numbers.Real, np.number, np.bool_))
+                if ufunc is not None and numeric and scalar:
+                    if scratch is None:
+                        scratch = np.empty(len(df), dtype=bool)
+                    ufunc(values.to_numpy(), operand, out=scratch)
+                    mask &= scratch
+                elif ufunc is None:
+                    mask &= values.isin(operand).to_numpy(dtype=bool, na_value=False)
+                else:
+                    mask &= ufunc(values, operand).to_numpy(dtype=bool, na_value=False)
+
+        return mask
 
     def create_base_cohort(
         self,
@@ -218,18 +463,18 @@ class CohortManager:
             )
         else:
             # Just get unique patients from demographics
-            if "demographics_maindata" in self.tables:
-                enrolled_patients = list(
-                    self.tables["demographics_maindata"]["FACPATID"].unique()
-                )
+            if "demographics_maindata" in self._coded_tables:
+                # Stays categorical: codes are reused below, no list of boxed ids
+                demographics = self._coded_tables["demographics_maindata"]
+                enrolled_patients = demographics["FACPATID"].drop_duplicates()
             else:
                 raise ValueError("demographics_maindata table not found")
 
-        cohort = pd.DataFrame({"FACPATID": enrolled_patients})
-        self._cohorts[name] = cohort
+        cohort_ids = self._encode_ids(enrolled_patients)
+        self._cohorts[name] = cohort_ids
 
-        logger.info(f"Created base cohort '{name}': {len(cohort)} patients")
-        return cohort
+        logger.info(f"Created base cohort '{name}': {len(cohort_ids)} patients")
+        return self._restore_ids(cohort_ids.to_frame(index=False))
 
     def filter_cohort(
         self,
@@ -265,69 +510,64 @@ class CohortManager:
         if source_cohort not in self._cohorts:
             raise ValueError(f"Source cohort not found: {source_cohort}")
 
-        source = self._cohorts[source_cohort].copy()
-
-        # Join with demographics (with age) for filtering
+        source = self._cohort_ids(source_cohort)
         demographics = self._get_demographics()
-        if not demographics.empty:
-            cohort = source.merge(demographics, on="FACPATID", how="left")
+
+        if custom_filter is None and not demographics.empty:
+            # Filter demographics alone and keep the matching ids, instead of joining
+            # every demographic column onto the cohort
+            resolved = self._resolve_filters(filters or {}, demographics)
+            mask = self._filter_mask(demographics, resolved)
+            kept_ids = demographics["FACPATID"].to_numpy()[mask]
+            keep = source.isin(kept_ids)
+
+            # Patients without demographics are treated as an all-missing row, as after a left join
+            absent = ~source.isin(demographics["FACPATID"])
+            if absent.any() and self._filter_mask(demographics.iloc[:0].reindex([0]), resolved)[0]:
+                keep |= absent
+
+            cohort_ids = source[keep].unique()
         else:
-            cohort = source
-
-        # Apply field filters
-        if filters:
-            for field, value in filters.items():
-                # Special handling for registry filter
-                if field == "registry":
-                    cohort = self._apply_registry_filter(cohort, value)
-                    continue
+            # custom_filter works on the merged frame
+            cohort = source.to_frame(index=False)
+            if not demographics.empty:
+                cohort = cohort.merge(demographics, on="FACPATID", how="left")
 
-                # Resolve field name
-                actual_field = self._resolve_filter_field(field, cohort)
-                if not actual_field:
-                    logger.warning(f"Filter field not found: {field}")
-                    continue
+            # All field filters are combined into one mask, so the merged frame is indexed once
+            if filters:
+                resolved = self._resolve_filters(filters, cohort)
+                cohort = cohort.loc[self._filter_mask(cohort, resolved)]
 
-                # Apply filter based on value type
-                if isinstance(value, dict):
-                    # Range filter: {"min": X, "max": Y}
-                    if "min" in value:
-                        cohort = cohort[cohort[actual_field] >= value["min"]]
-                    if "max" in value:
-                        cohort = cohort[cohort[actual_field] <= value["max"]]
-                elif isinstance(value, tuple) and len(value) == 2:
-                    # Legacy range filter: (min, max)
-                    cohort = cohort[
-                        (cohort[actual_field] >= value[0]) &
-                        (cohort[actual_field] <= value[1])
-                    ]
-                elif isinstance(value, list):
-                    # Multiple values
-                    cohort = cohort[cohort[actual_field].isin(value)]
-                else:
-                    # Exact match
-                    cohort = cohort[cohort[actual_field] == value]
+            # Apply custom filter (it sees FACPATID in the tables' own dtype)
+            if custom_filter:
+                cohort = self._restore_ids(cohort)
+                cohort = cohort[custom_filter(cohort)]
 
-        # Apply custom filter
-        if custom_filter:
-            cohort = cohort[custom_filter(cohort)]
+            cohort_ids = self._encode_ids(cohort["FACPATID"]).unique()
 
-        # Keep only FACPATID
-        cohort = cohort[["FACPATID"]].drop_duplicates()
-        self._cohorts[name] = cohort
+        self._cohorts[name] = cohort_ids
 
         logger.info(
             f"Created cohort '{name}' from '{source_cohort}': "
-            f"{len(cohort)} patients ({len(source) - len(cohort)} filtered out)"
+            f"{len(cohort_ids)} patients ({len(source) - len(cohort_ids)} filtered out)"
         )
 
+        return self._restore_ids(cohort_ids.to_frame(index=False))
+
+    def _cohort_ids(self, name: str) -> pd.Index:
+        """Get a cohort's FACPATIDs as an Index."""
+        if name not in self._cohorts:
+            raise ValueError(f"Cohort not found: {name}")
+
+        cohort = self._cohorts[name]
+        if isinstance(cohort, pd.DataFrame):
+            # Cohort assigned directly as a FACPATID frame
+            return pd.Index(cohort["FACPATID"], name="FACPATID")
         return cohort
 
     def get_cohort(self, name: str) -> pd.DataFrame:
         """Get a cohort by name."""
-        if name not in self._cohorts:
-            raise ValueError(f"Cohort not found: {name}")
-        return self._cohorts[name]
+        return self._restore_ids(self._cohort_ids(name).to_frame(index=False))
 
     def list_cohorts(self) -> List[str]:
         """List all cohort names."""
@@ -348,19 +588,21 @@ class CohortManager:
         Returns:
             DataFrame with FACPATID and optionally demographic data
         """
-        cohort = self.get_cohort(name)
+        cohort = self._cohort_ids(name).to_frame(index=False)
 
         if include_demographics:
             demographics = self._get_demographics()
             if not demographics.empty:
-                return cohort.merge(demographics, on="FACPATID", how="left")
+                cohort = cohort.merge(demographics, on="FACPATID", how="left")
 
-        return cohort
+        return self._restore_ids(cohort)
 
     def get_filtered_tables(
         self,
         name: str,
-        tables: Optional[List[str]] = None
+        tables: Optional[List[str]] = None,
+        copy: bool = False,
+        max_workers: int = 1
     ) -> Dict[str, pd.DataFrame]:
         """
         Get all tables filtered to a cohort's FACPATIDs.
@@ -372,6 +614,12 @@ class CohortManager:
         Args:
             name: Cohort name
             tables: Optional list of table names to filter. If None, filters all tables.
+            copy: Return independent copies. By default filtered tables are the new
+                frames produced by boolean indexing, and tables without FACPATID are
+                returned as-is (shared with the manager), so copy before mutating them.
+            max_workers: Filter up to this many tables concurrently in threads. The
+                row gathers run in numpy/pyarrow kernels that release the GIL, which
+                helps with many large tables.
 
         Returns:
             Dict mapping table names to filtered DataFrames
@@ -382,26 +630,100 @@ class CohortManager:
             >>> filtered['demographics_maindata']  # Only DMD patients
             >>> filtered['encounter_maindata']     # Only DMD encounters
         """
-        cohort_ids = self.get_cohort(name)['FACPATID']
+        cohort_ids = self._cohort_ids(name)
         tables_to_filter = tables or list(self.tables.keys())
 
-        filtered = {}
+        # Build the membership lookup once for all tables: with shared categories a
+        # boolean presence table indexed by code, otherwise a single hash set
+        presence = None
+        if isinstance(cohort_ids, pd.CategoricalIndex):
+            presence = np.zeros(len(cohort_ids.categories) + 1, dtype=bool)
+            presence[cohort_ids.codes] = True
+            presence[-1] = False  # code -1: missing FACPATID
+            cohort_codes = np.flatnonzero(presence[:-1])
+        cohort_set = set(cohort_ids.dropna()) if presence is None else None
+
+        def filter_table(table_name: str) -> pd.DataFrame:
+            # Rows are selected on the coded table and taken from the caller's table,
+            # so FACPATID keeps its original dtype
+            source = self.tables[table_name]
+            df = self._coded_tables[table_name]
+            if 'FACPATID' not in df.columns:
+                # Table doesn't have FACPATID - include as-is with warning
+                logger.debug(f"Table {table_name} has no FACPATID column, including unfiltered")
+                return source.copy() if copy else source
+
+            facpatid = df['FACPATID']
+            if presence is not None and facpatid.dtype == cohort_ids.dtype:
+                rows = self._cohort_rows(table_name, df, cohort_codes)
+                if rows is not None:
+                    subset = source.take(rows)
+                else:
+                    subset = source[presence[facpatid.cat.codes.to_numpy()]]
+            else:
+                ids = cohort_set if cohort_set is not None else cohort_ids.dropna()
+                subset = source[facpatid.isin(ids)]
+            return subset.copy() if copy else subset
+
+        names = []
         for table_name in tables_to_filter:
-            if table_name not in self.tables:
+            if table_name not in self._coded_tables:
                 logger.warning(f"Table not found: {table_name}")
                 continue
+            names.append(table_name)
 
-            df = self.tables[table_name]
-            if 'FACPATID' in df.columns:
-                filtered[table_name] = df[df['FACPATID'].isin(cohort_ids)].copy()
-            else:
-                # Table doesn't have FACPATID - include as-is with warning
-                logger.debug(f"Table {table_name} has no FACPATID column, including unfiltered")
-                filtered[table_name] = df.copy()
+        if max_workers > 1 and len(names) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+                filtered = dict(zip(names, executor.map(filter_table, names)))
+        else:
+            filtered = {table_name: filter_table(table_name) for table_name in names}
 
         logger.info(f"Filtered {len(filtered)} tables to cohort '{name}' ({len(cohort_ids)} patients)")
         return filtered
 
+    def _facpatid_rows(self, table_name: str, df: pd.DataFrame) -> tuple:
+        """
+        Get a table's row positions grouped by FACPATID code (CSR layout).
+
+        Rows of the patient with code ``c`` are ``rows[offsets[c]:offsets[c + 1]]``.
+        Built once per table and reused for every cohort.
+        """
+        cached = self._facpatid_row_index.get(table_name)
+        if cached is not None and cached[0] is df:
+            return cached[1], cached[2]
+
+        codes = df["FACPATID"].cat.codes.to_numpy()
+        n_categories = len(df["FACPATID"].cat.categories)
+
+        valid = np.flatnonzero(codes >= 0)
+        rows = valid[np.argsort(codes[valid], kind="stable")]
+        offsets = np.zeros(n_categories + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes[valid], minlength=n_categories), out=offsets[1:])
+
+        self._facpatid_row_index[table_name] = (df, rows, offsets)
+        return rows, offsets
+
+    def _cohort_rows(
+        self, table_name: str, df: pd.DataFrame, cohort_codes: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Get the sorted row positions of a cohort's patients in a table.
+
+        Returns None when the cohort covers a large share of the table, where a
+        single mask pass over the table is cheaper than gathering rows.
+        """
+        rows, offsets = self._facpatid_rows(table_name, df)
+        starts = offsets[cohort_codes]
+        counts = offsets[cohort_codes + 1] - starts
+        total = int(counts.sum())
+
+        if total * 8 > len(df):
+            return None
+
+        # Concatenate the rows[start:start + count] slices without a Python loop
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        return np.sort(rows[positions])
+
     def get_cohort_summary(self, name: str) -> dict:
         """
         Get summary statistics for cohort.
@@ -412,7 +734,7 @@ class CohortManager:
         Returns:
             Dict with summary statistics
         """
-        cohort = self.get_cohort(name)
+        cohort = self._cohort_ids(name).to_frame(index=False)
         demographics = self._get_demographics()
 
         if demographics.empty:
@@ -434,7 +756,7 @@ class CohortManager:
 
         # Gender distribution
         if gender_col:
-            summary["gender_distribution"] = merged[gender_col].value_counts().to_dict()
+            summary["gender_distribution"] = self._distribution(merged[gender_col])
 
         # Age statistics
         if age_col and merged[age_col].notna().any():
@@ -447,11 +769,12 @@ class CohortManager:
 
         # Disease distribution
         if disease_col:
-            summary["disease_distribution"] = merged[disease_col].value_counts().to_dict()
+            summary["disease_distribution"] = self._distribution(merged[disease_col])
 
         # Registry distribution
         if registry_col:
-            usndr_count = (merged[registry_col] == True).sum()
+            is_usndr = (merged[registry_col] == True).to_numpy(dtype=bool, na_value=False)
+            usndr_count = np.count_nonzero(is_usndr)
             datahub_count = len(merged) - usndr_count
             summary["registry_distribution"] = {
                 "USNDR": int(usndr_count),
@@ -460,6 +783,19 @@ class CohortManager:
 
         return summary
 
+    @staticmethod
+    def _distribution(values: pd.Series) -> Dict[Any, int]:
+        """
+        Count occurrences of each value, most common first (missing values excluded).
+
+        One factorize pass (just the codes for categoricals) plus a bincount; only the
+        handful of distinct values is sorted, ties keeping first-seen order.
+        """
+        codes, uniques = pd.factorize(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        order = np.argsort(-counts, kind="stable")
+        return dict(zip(uniques.take(order).tolist(), counts[order].tolist()))
+
     def export_cohort(self, name: str, output_path: str):
         """
         Export cohort to file.
@@ -475,7 +811,7 @@ class CohortManager:
         elif output_path.endswith('.xlsx'):
             cohort.to_excel(output_path, index=False)
         elif output_path.endswith('.parquet'):
-            cohort.to_parquet(output_path, index=False)
+            cohort.to_parquet(output_path, index=False, engine="pyarrow", compression="zstd")
         else:
             raise ValueError(f"Unsupported file format: {output_path}")
 
@@ -4,8 +4,10 @@ Enrollment validation for MOVR cohorts.
 Validates that participants have required forms for enrollment.
 """
 
+from functools import reduce
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Set
+from typing import Dict, List
 from loguru import logger
 
 
@@ -21,6 +23,17 @@ class EnrollmentValidator:
         """
         self.tables = tables
 
+    @staticmethod
+    def _intersect_patients(columns: List[pd.Series]) -> pd.Index:
+        """Get the FACPATIDs present in every column."""
+        dtype = columns[0].dtype
+        if isinstance(dtype, pd.CategoricalDtype) and all(col.dtype == dtype for col in columns):
+            # Shared categories: intersect integer codes (missing ids are code -1)
+            codes = reduce(np.intersect1d, (col.cat.codes.to_numpy() for col in columns))
+            return dtype.categories.take(codes[codes >= 0])
+
+        return reduce(pd.Index.intersection, (pd.Index(col.unique()) for col in columns))
+
     def get_enrolled_patients(
         self,
         required_forms: List[str] = None
@@ -41,27 +54,27 @@ class EnrollmentValidator:
                 "encounter_maindata"
             ]
 
-        patient_sets = []
+        patient_columns = []
 
         for form_name in required_forms:
             if form_name not in self.tables:
                 logger.warning(f"Required form not found: {form_name}")
                 continue
 
-            patients = set(self.tables[form_name]["FACPATID"].unique())
-            patient_sets.append(patients)
+            patient_columns.append(self.tables[form_name]["FACPATID"])
 
-        if not patient_sets:
+        if not patient_columns:
             raise ValueError("No required forms found in tables")
 
         # Get intersection (patients with ALL required forms)
-        enrolled = set.intersection(*patient_sets)
+        enrolled = self._intersect_patients(patient_columns)
 
         logger.info(
             f"Enrollment validation: {len(enrolled)} patients with all {len(required_forms)} required forms"
         )
 
-        return list(enrolled)
+        patients: List[str] = enrolled.tolist()
+        return patients
 
     def validate_enrollment(
         self,
@@ -83,34 +96,36 @@ class EnrollmentValidator:
                 "encounter_maindata"
             ]
 
-        form_patients: Dict[str, Set[str]] = {}
+        form_patients: Dict[str, pd.Index] = {}
 
         for form_name in required_forms:
             if form_name in self.tables:
-                form_patients[form_name] = set(
+                form_patients[form_name] = pd.Index(
                     self.tables[form_name]["FACPATID"].unique()
                 )
             else:
                 logger.warning(f"Form not found: {form_name}")
-                form_patients[form_name] = set()
+                form_patients[form_name] = pd.Index([])
 
         # Get enrolled patients
         if form_patients:
-            enrolled = set.intersection(*form_patients.values())
+            enrolled = reduce(pd.Index.intersection, form_patients.values())
         else:
-            enrolled = set()
+            enrolled = pd.Index([])
 
         # Get patients missing each form
-        all_patients = set.union(*form_patients.values()) if form_patients else set()
+        all_patients = (
+            reduce(pd.Index.union, form_patients.values()) if form_patients else pd.Index([])
+        )
         missing_by_form = {}
 
         for form_name, patients in form_patients.items():
-            missing_by_form[form_name] = list(all_patients - patients)
+            missing_by_form[form_name] = all_patients.difference(patients)
 
         report = {
             "enrolled_count": len(enrolled),
             "total_unique_patients": len(all_patients),
-            "enrolled_patients": list(enrolled),
+            "enrolled_patients": enrolled.tolist(),
             "form_counts": {
                 name: len(patients)
                 for name, patients in form_patients.items()
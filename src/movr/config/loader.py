@@ -8,15 +8,54 @@ Priority order:
 4. Built-in defaults
 """
 
+import copy
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from movr.config.schema import MOVRConfig
 
 
+@lru_cache(maxsize=8)
+def _load_yaml(path: Path, mtime_ns: int) -> Any:
+    """Parse a YAML config file, cached per path and modification time."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=8)
+def _find_config_file_in(cwd: Path) -> Optional[Path]:
+    """Find config file in standard locations relative to cwd, including parent directories."""
+    # Current directory first (returned relative), then parents - useful when running
+    # from subdirectories like notebooks/. Limit search depth to 5 levels.
+    bases = [Path(".")] + list(cwd.resolve().parents)[:5]
+
+    for depth, base in enumerate(bases):
+        config_dir = base / "config"
+        # One stat per level skips the lookups where there is no config/ at all
+        if not config_dir.is_dir():
+            continue
+        for config_name in ("local.yaml", "config.yaml"):
+            config_path = config_dir / config_name
+            if config_path.is_file():
+                if depth == 0:
+                    logger.info(f"Found config file: {config_path}")
+                else:
+                    logger.info(f"Found config file in parent: {config_path}")
+                return config_path
+
+    logger.warning("No config file found, using defaults")
+    return None
+
+
 class ConfigLoader:
     """Load and manage MOVR configuration."""
 
@@ -32,35 +71,8 @@ class ConfigLoader:
         self._config: Optional[MOVRConfig] = None
 
     def _find_config_file(self) -> Optional[Path]:
-        """Find config file in standard locations, including parent directories."""
-        # First, check current directory and explicit cwd
-        search_paths = [
-            Path("config/local.yaml"),
-            Path("config/config.yaml"),
-            Path.cwd() / "config/local.yaml",
-            Path.cwd() / "config/config.yaml",
-        ]
-
-        for path in search_paths:
-            if path.exists():
-                logger.info(f"Found config file: {path}")
-                return path
-
-        # Search parent directories (useful when running from subdirectories like notebooks/)
-        current = Path.cwd().resolve()
-        for _ in range(5):  # Limit search depth
-            parent = current.parent
-            if parent == current:  # Reached filesystem root
-                break
-            for config_name in ["config/local.yaml", "config/config.yaml"]:
-                config_path = parent / config_name
-                if config_path.exists():
-                    logger.info(f"Found config file in parent: {config_path}")
-                    return config_path
-            current = parent
-
-        logger.warning("No config file found, using defaults")
-        return None
+        """Find config file in standard locations (memoized per working directory)."""
+        return _find_config_file_in(Path.cwd())
 
     def load(self) -> MOVRConfig:
         """
@@ -77,10 +89,11 @@ class ConfigLoader:
 
         # Load from file if exists
         if self.config_path and self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                file_config = yaml.safe_load(f)
-                if file_config:
-                    config_dict.update(file_config)
+            # Deep-copied so the cached parse is never mutated
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            file_config = copy.deepcopy(_load_yaml(self.config_path, mtime_ns))
+            if file_config:
+                config_dict.update(file_config)
 
         # Override with environment variables
         env_overrides = self._load_env_vars()
@@ -146,6 +159,8 @@ def get_config(config_path: Optional[Path] = None, reload: bool = False) -> MOVR
     global _global_config
 
     if _global_config is None or reload:
+        if reload:
+            _find_config_file_in.cache_clear()
         loader = ConfigLoader(config_path)
         _global_config = loader.load()
 
@@ -77,6 +77,14 @@ class PathConfig(BaseModel):
         return PathConfig(**resolved)
 
 
+class ConversionConfig(BaseModel):
+    """Parquet output settings for Excel conversion."""
+
+    compression: str = "zstd"
+    compression_level: Optional[int] = 3  # null for codecs without levels (e.g. snappy)
+    row_group_size: int = 131072
+
+
 class AuditConfig(BaseModel):
     """Audit trail configuration."""
 
@@ -107,6 +115,7 @@ class MOVRConfig(BaseModel):
     data_sources: List[DataSourceConfig] = Field(default_factory=list)
     wrangling: WranglingConfig = Field(default_factory=WranglingConfig)
     paths: PathConfig = Field(default_factory=PathConfig)
+    conversion: ConversionConfig = Field(default_factory=ConversionConfig)
     audit: AuditConfig = Field(default_factory=AuditConfig)
     metadata: MetadataConfig = Field(default_factory=MetadataConfig)
 
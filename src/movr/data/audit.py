@@ -4,14 +4,37 @@ Audit logging for data operations.
 Tracks conversions, transformations, and analyses for reproducibility.
 """
 
+import atexit
 import json
+import queue
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO
 from datetime import datetime
 from loguru import logger
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 from movr.config import get_config
 
+# Writer thread flushes the file buffer at least this often
+_FLUSH_EVERY = 64
+
+# Session log format implied by a filename suffix
+_LOG_FORMATS = {'.json': 'json', '.parquet': 'parquet'}
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize an audit entry as one JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(entry) + '\n').encode('utf-8')
+
 
 class AuditLogger:
     """Log data operations for audit trail and reproducibility."""
@@ -30,6 +53,37 @@ class AuditLogger:
 
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_log: List[Dict[str, Any]] = []
+        self._log_fh: Optional[BinaryIO] = None
+
+        # Entries are serialized by the caller (so bad values raise there) and
+        # written by a background thread, keeping file I/O off the critical path
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "AuditLogger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def flush(self):
+        """Wait for queued entries and flush them to the session's JSONL log."""
+        if self._writer is None:
+            return
+        self._queue.join()
+        # The writer is idle once the queue is drained
+        self._log_fh.flush()
+
+    def close(self):
+        """Drain queued entries, stop the writer thread and close the JSONL log."""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+        self._log_fh.close()
+        self._log_fh = None
+        atexit.unregister(self.close)
 
     def log_conversion(
         self,
@@ -138,33 +192,105 @@ class AuditLogger:
         self._write_entry(entry)
 
     def _write_entry(self, entry: Dict[str, Any]):
-        """Write audit entry to log file."""
-        log_file = self.log_dir / f"audit_{self.session_id}.jsonl"
+        """Serialize an audit entry and queue it for the background writer."""
+        line = _dumps_line(entry)
+        if self._writer is None:
+            # Opened on first write and kept open; drained on flush/close/exit
+            log_file = self.log_dir / f"audit_{self.session_id}.jsonl"
+            self._log_fh = open(log_file, 'ab', buffering=64 * 1024)
+            self._writer = threading.Thread(
+                target=self._drain, name=f"audit-{self.session_id}", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
+        self._queue.put(line)
 
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+    def _drain(self):
+        """Writer thread: write queued lines to the log file until closed."""
+        pending = 0
+        while True:
+            line = self._queue.get()
+            try:
+                if line is None:
+                    self._log_fh.flush()
+                    return
+                self._log_fh.write(line)
+                pending += 1
+                if pending >= _FLUSH_EVERY or self._queue.empty():
+                    self._log_fh.flush()
+                    pending = 0
+            except Exception as e:
+                logger.warning(f"Failed to write audit entry: {e}")
+            finally:
+                self._queue.task_done()
 
-    def save_session_log(self, filename: Optional[str] = None):
+    def save_session_log(self, filename: Optional[str] = None, format: Optional[str] = None):
         """
-        Save complete session log to JSON file.
+        Save complete session log.
+
+        Parquet (the default) is compact and can be queried with the same
+        tooling as the data; one row per entry, with nested values such as
+        ``details`` and ``parameters`` stored as JSON strings. Use
+        ``format="json"`` for an indented, human-readable file.
 
         Args:
             filename: Optional custom filename
+            format: "parquet" or "json". When omitted, a custom filename's suffix
+                decides (".parquet" or ".json"; any other suffix keeps writing
+                JSON), otherwise Parquet.
+
+        Raises:
+            ValueError: If the format is unknown or conflicts with the filename suffix
         """
+        suffix_format = _LOG_FORMATS.get(Path(filename).suffix.lower()) if filename else None
+        if format is None:
+            format = suffix_format or ("json" if filename else "parquet")
+        if format not in ("parquet", "json"):
+            raise ValueError(f"Unknown audit log format: {format}")
+        if suffix_format is not None and suffix_format != format:
+            raise ValueError(f"Audit log format {format!r} does not match filename: {filename}")
+
         if not self.session_log:
             logger.warning("No audit entries to save")
             return
 
         if filename is None:
-            filename = f"audit_session_{self.session_id}.json"
+            filename = f"audit_session_{self.session_id}.{format}"
 
         output_path = self.log_dir / filename
+        self.flush()
 
-        with open(output_path, 'w') as f:
-            json.dump({
-                'session_id': self.session_id,
-                'entries': self.session_log
-            }, f, indent=2)
+        if format == "json":
+            with open(output_path, 'w') as f:
+                json.dump({
+                    'session_id': self.session_id,
+                    'entries': self.session_log
+                }, f, indent=2)
+        else:
+            pq.write_table(self._session_table(), output_path, compression='zstd')
 
         logger.info(f"Audit log saved to: {output_path}")
         return output_path
+
+    def _session_table(self) -> pa.Table:
+        """Session log as an Arrow table with one column per entry field."""
+        # Entry kinds have different fields; take the union in first-seen order
+        fields = {'session_id': None}
+        for entry in self.session_log:
+            fields.update(dict.fromkeys(entry))
+
+        columns: Dict[str, List[Any]] = {}
+        for field in fields:
+            if field == 'session_id':
+                columns[field] = [self.session_id] * len(self.session_log)
+                continue
+            values: List[Any] = [entry.get(field) for entry in self.session_log]
+            if any(isinstance(value, (dict, list)) for value in values):
+                values = [
+                    None if value is None else json.dumps(value, default=str)
+                    for value in values
+                ]
+            columns[field] = values
+
+        return pa.table(columns)
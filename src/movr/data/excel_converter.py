@@ -4,15 +4,133 @@ Excel to Parquet conversion with audit logging.
 Handles multi-sheet Excel files and converts them to efficient Parquet format.
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 from datetime import datetime
 
 from movr.config import get_config
 from movr.data.audit import AuditLogger
 
+# Fresh interpreters for conversion workers; forking a parent that already
+# holds pandas/openpyxl/arrow thread pools can deadlock
+_SPAWN = multiprocessing.get_context("spawn")
+
+
+def _open_workbook(excel_path: Path) -> pd.ExcelFile:
+    """
+    Open a workbook with the fastest available reader.
+
+    The calamine engine (``python-calamine``, pandas >= 2.2) streams rows
+    instead of building an XML DOM per sheet; fall back to openpyxl when it
+    isn't installed.
+    """
+    try:
+        return pd.ExcelFile(excel_path, engine="calamine")
+    except (ImportError, ValueError):
+        return pd.ExcelFile(excel_path)
+
+
+def _write_sheet(
+    excel_file: pd.ExcelFile,
+    sheet_name: str,
+    table_name: str,
+    output_dir: Path,
+    write_options: Dict[str, Any]
+) -> Tuple[str, Path, int, List[str], float]:
+    """
+    Convert one sheet of an open workbook to Parquet.
+
+    ``write_options`` are passed through to ``pyarrow.parquet.write_table``.
+
+    Returns:
+        Tuple of (table name, output path, row count, column names, file size in MB)
+    """
+    logger.info(f"Reading sheet: {sheet_name} → {table_name}")
+    # Hand the sheet to Arrow once and drop the DataFrame so only one
+    # columnar copy is alive while the Parquet file is written
+    table = pa.Table.from_pandas(excel_file.parse(sheet_name=sheet_name), preserve_index=False)
+
+    # Basic info
+    n_rows = table.num_rows
+    columns = table.schema.names
+    logger.info(f"  {sheet_name}: Rows: {n_rows:,}, Columns: {len(columns)}")
+
+    # Write to Parquet: dictionary-encode codes/strings/ints, byte-stream-split
+    # floats (the two are exclusive per column), with statistics for pushdown
+    float_columns = [
+        name for name, type_ in zip(table.column_names, table.schema.types)
+        if pa.types.is_floating(type_)
+    ]
+    encoding_options: Dict[str, Any] = {'use_dictionary': True}
+    if float_columns:
+        encoding_options = {
+            'use_dictionary': [name for name in table.column_names if name not in float_columns],
+            'column_encoding': {name: 'BYTE_STREAM_SPLIT' for name in float_columns},
+        }
+
+    output_path = output_dir / f"{table_name}.parquet"
+    pq.write_table(
+        table, output_path, write_statistics=True, data_page_size=1 << 20,
+        **encoding_options, **write_options
+    )
+    del table
+
+    # Get file size
+    file_size_mb = output_path.stat().st_size / (1024 * 1024)
+    logger.info(f"  Written to: {output_path} ({file_size_mb:.2f} MB)")
+
+    return table_name, output_path, n_rows, columns, file_size_mb
+
+
+def _convert_one_sheet(
+    excel_path: Path,
+    sheet_name: str,
+    table_name: str,
+    output_dir: Path,
+    write_options: Dict[str, Any]
+) -> Tuple[str, Path, int, List[str], float]:
+    """
+    Convert a single sheet to Parquet in a worker process.
+
+    Opens its own workbook handle and leaves audit logging to the caller.
+    """
+    with _open_workbook(excel_path) as excel_file:
+        return _write_sheet(excel_file, sheet_name, table_name, output_dir, write_options)
+
+
+def _run_sheet_jobs(jobs: List[tuple], max_workers: int = 1) -> List[tuple]:
+    """
+    Run sheet conversion jobs serially, or across worker processes.
+
+    Serially, each workbook is opened once for all of its sheets. With
+    ``max_workers > 1`` every sheet is parsed in a spawned process; spawned
+    workers re-import the caller's ``__main__``, so scripts must guard their
+    entry point with ``if __name__ == "__main__":``.
+
+    Returns:
+        Results in the same order as ``jobs``
+    """
+    if max_workers > 1 and len(jobs) > 1:
+        workers = min(max_workers, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_SPAWN) as executor:
+            futures = [executor.submit(_convert_one_sheet, *job) for job in jobs]
+            return [future.result() for future in futures]
+
+    results: List[tuple] = []
+    # Jobs are grouped by workbook, one run of consecutive jobs per file
+    for excel_path, file_jobs in groupby(jobs, key=itemgetter(0)):
+        with _open_workbook(excel_path) as excel_file:
+            results.extend(_write_sheet(excel_file, *job[1:]) for job in file_jobs)
+    return results
+
 
 class ExcelConverter:
     """Convert Excel files to Parquet with audit logging."""
@@ -32,7 +150,8 @@ class ExcelConverter:
         excel_path: Path,
         sheet_mappings: Dict[str, str],
         skip_sheets: Optional[List[str]] = None,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        max_workers: int = 1
     ) -> Dict[str, Path]:
         """
         Convert Excel file to Parquet files.
@@ -42,10 +161,38 @@ class ExcelConverter:
             sheet_mappings: Dict mapping sheet names to table names
             skip_sheets: Optional list of sheets to skip
             output_dir: Optional output directory (default: data/parquet)
+            max_workers: Number of worker processes converting sheets in parallel
+                (default 1: serial, parsing the workbook once). Workers are spawned,
+                so scripts passing more than 1 need an ``if __name__ == "__main__":``
+                guard.
 
         Returns:
             Dict mapping table names to Parquet file paths
         """
+        jobs = self._sheet_jobs(excel_path, sheet_mappings, skip_sheets, output_dir)
+        conversion_start = datetime.now()
+
+        # Sheets are independent read/parse/write jobs; workers (if any) convert,
+        # audit logging stays in the parent
+        results = self._log_conversions(jobs, _run_sheet_jobs(jobs, max_workers))
+
+        conversion_end = datetime.now()
+        duration = (conversion_end - conversion_start).total_seconds()
+
+        logger.success(
+            f"Conversion complete: {len(results)} tables in {duration:.1f}s"
+        )
+
+        return results
+
+    def _sheet_jobs(
+        self,
+        excel_path: Path,
+        sheet_mappings: Dict[str, str],
+        skip_sheets: Optional[List[str]] = None,
+        output_dir: Optional[Path] = None
+    ) -> List[tuple]:
+        """Resolve the ``_convert_one_sheet`` arguments for each sheet to convert."""
         excel_path = Path(excel_path)
         if not excel_path.exists():
             raise FileNotFoundError(f"Excel file not found: {excel_path}")
@@ -57,65 +204,69 @@ class ExcelConverter:
 
         logger.info(f"Converting Excel file: {excel_path}")
 
-        # Read Excel file
-        excel_file = pd.ExcelFile(excel_path)
-        results = {}
-        conversion_start = datetime.now()
+        # Resolve which sheets to convert
+        with _open_workbook(excel_path) as excel_file:
+            available = set(excel_file.sheet_names)
 
+        # Written once, read on every load: favour smaller files, and keep row
+        # groups bounded so readers can parallelize across them
+        conversion = self.config.conversion
+        write_options = {
+            'compression': conversion.compression,
+            'compression_level': conversion.compression_level,
+            'row_group_size': conversion.row_group_size,
+        }
+
+        jobs = []
         for sheet_name, table_name in sheet_mappings.items():
             if sheet_name in skip_sheets:
                 logger.info(f"Skipping sheet: {sheet_name}")
                 continue
 
-            if sheet_name not in excel_file.sheet_names:
+            if sheet_name not in available:
                 logger.warning(f"Sheet not found in Excel file: {sheet_name}")
                 continue
 
-            # Read sheet
-            logger.info(f"Reading sheet: {sheet_name} → {table_name}")
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-
-            # Basic info
-            n_rows = len(df)
-            n_cols = len(df.columns)
-            logger.info(f"  Rows: {n_rows:,}, Columns: {n_cols}")
+            jobs.append((excel_path, sheet_name, table_name, output_dir, write_options))
 
-            # Write to Parquet
-            output_path = output_dir / f"{table_name}.parquet"
-            df.to_parquet(output_path, index=False, compression='snappy')
+        return jobs
 
-            # Get file size
-            file_size_mb = output_path.stat().st_size / (1024 * 1024)
-            logger.info(f"  Written to: {output_path} ({file_size_mb:.2f} MB)")
-
-            # Audit log
+    def _log_conversions(self, jobs: List[tuple], converted: List[tuple]) -> Dict[str, Path]:
+        """Audit-log converted sheets in job order so the trail is deterministic."""
+        results = {}
+        for job, result in zip(jobs, converted):
+            excel_path, sheet_name = job[:2]
+            table_name, output_path, n_rows, columns, file_size_mb = result
             self.audit.log_conversion(
                 source=excel_path,
                 sheet=sheet_name,
                 table=table_name,
                 rows=n_rows,
-                columns=list(df.columns),
+                columns=columns,
                 output_path=output_path,
                 file_size_mb=file_size_mb
             )
 
             results[table_name] = output_path
 
-        conversion_end = datetime.now()
-        duration = (conversion_end - conversion_start).total_seconds()
-
-        logger.success(
-            f"Conversion complete: {len(results)} tables in {duration:.1f}s"
-        )
-
         return results
 
-    def convert_all_sources(self, clean_existing: bool = False) -> Dict[str, Path]:
+    def convert_all_sources(
+        self,
+        clean_existing: bool = False,
+        max_workers: int = 1
+    ) -> Dict[str, Path]:
         """
         Convert all data sources defined in config.
 
+        With ``max_workers > 1``, sheets from every source share one process
+        pool, so files and the sheets within them are converted in parallel.
+
         Args:
             clean_existing: If True, remove all existing Parquet files before conversion
+            max_workers: Number of worker processes (default 1: serial). Workers are
+                spawned, so scripts passing more than 1 need an
+                ``if __name__ == "__main__":`` guard.
 
         Returns:
             Dict mapping table names to Parquet file paths
@@ -131,15 +282,22 @@ class ExcelConverter:
                     file.unlink()
                     logger.debug(f"  Removed: {file.name}")
 
-        all_results = {}
-
+        jobs = []
         for source in self.config.data_sources:
             logger.info(f"Converting data source: {source.name}")
-            results = self.convert_file(
+            jobs.extend(self._sheet_jobs(
                 excel_path=Path(source.excel_path),
                 sheet_mappings=source.sheet_mappings,
                 skip_sheets=source.skip_sheets
-            )
-            all_results.update(results)
+            ))
+
+        conversion_start = datetime.now()
+        all_results = self._log_conversions(jobs, _run_sheet_jobs(jobs, max_workers))
+        duration = (datetime.now() - conversion_start).total_seconds()
+
+        logger.success(
+            f"Conversion complete: {len(all_results)} tables from "
+            f"{len(self.config.data_sources)} sources in {duration:.1f}s"
+        )
 
         return all_results
@@ -5,48 +5,149 @@ Parquet file loader with caching support.
 Provides efficient loading of Parquet files with optional caching.
 """
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from loguru import logger
 from datetime import datetime
 
 from movr.config import get_config
 
 
+def _default_cache_bytes() -> Optional[int]:
+    """Default cache budget: a quarter of physical memory (None if unknown)."""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 4
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _filters_key(filters: Any) -> Any:
+    """
+    Hashable cache key for DNF filters made of tuples/lists of plain values.
+
+    Raises:
+        TypeError: If the filters contain anything else (e.g. compute expressions)
+    """
+    if isinstance(filters, (list, tuple)):
+        return tuple(_filters_key(item) for item in filters)
+    if isinstance(filters, (set, frozenset)):
+        return frozenset(_filters_key(item) for item in filters)
+    if filters is None or isinstance(filters, (str, bytes, bool, int, float)):
+        return filters
+    raise TypeError(f"Unhashable filter value: {filters!r}")
+
+
 class ParquetLoader:
     """Load Parquet files with optional caching."""
 
-    def __init__(self, cache_enabled: bool = True, verbose: bool = True):
+    def __init__(
+        self,
+        cache_enabled: bool = True,
+        verbose: bool = True,
+        max_cache_bytes: Optional[int] = None,
+        track_memory: bool = False
+    ):
         """
         Initialize Parquet loader.
 
         Args:
             cache_enabled: Enable in-memory caching of loaded tables
             verbose: Enable verbose logging
+            max_cache_bytes: Byte budget for cached tables; least recently used
+                tables are evicted beyond it (default: 25% of physical memory)
+            track_memory: Record file and memory sizes in the load history even
+                when not verbose (otherwise they are recorded as None)
         """
         self.config = get_config()
         self.cache_enabled = cache_enabled
         self.verbose = verbose
-        self._cache: Dict[str, pd.DataFrame] = {}
+        self.track_memory = track_memory
+        if max_cache_bytes is None:
+            max_cache_bytes = _default_cache_bytes()
+        self.max_cache_bytes = max_cache_bytes
+        self._cache: "OrderedDict[tuple, pa.Table]" = OrderedDict()
+        self._cache_bytes = 0
+        # Guards the cache and load history when tables load on several threads
+        self._lock = threading.Lock()
         self.load_history: List[dict] = []
 
-    def load_table(self, table_name: str, force_reload: bool = False) -> pd.DataFrame:
+    def load_table(
+        self,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        force_reload: bool = False,
+        filters: Optional[List[Any]] = None
+    ) -> pd.DataFrame:
         """
         Load a single Parquet table.
 
         Args:
             table_name: Name of the table to load
+            columns: Optional subset of columns to read (default: all columns)
             force_reload: Force reload even if cached
+            filters: Optional pyarrow row filters (e.g. ``[('dstype', '==', 'DMD')]``),
+                pushed down to row-group statistics. Filters made of plain values are
+                part of the cache key; other filter objects are read uncached.
 
         Returns:
             DataFrame
         """
+        table = self.load_table_arrow(table_name, columns, force_reload, filters)
+
+        # The cache holds Arrow tables; convert on demand. The default conversion
+        # copies into consolidated blocks, so callers get a writable frame.
+        return table.to_pandas()
+
+    def _cache_key(
+        self,
+        table_name: str,
+        columns: Optional[List[str]],
+        filters: Optional[List[Any]]
+    ) -> Optional[tuple]:
+        """Cache key for a read, or None if the read is not cached."""
+        if not self.cache_enabled:
+            return None
+        try:
+            filters_key = _filters_key(filters)
+        except TypeError:
+            return None
+        # Projected, filtered and full reads are cached separately
+        return (table_name, tuple(columns) if columns is not None else None, filters_key)
+
+    def load_table_arrow(
+        self,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        force_reload: bool = False,
+        filters: Optional[List[Any]] = None
+    ) -> pa.Table:
+        """
+        Load a single Parquet table as a pyarrow Table.
+
+        Same arguments as :meth:`load_table`, without the pandas conversion.
+
+        Returns:
+            pyarrow Table
+        """
+        cache_key = self._cache_key(table_name, columns, filters)
+
         # Check cache
-        if self.cache_enabled and not force_reload and table_name in self._cache:
-            if self.verbose:
-                logger.info(f"Loading {table_name} from cache")
-            return self._cache[table_name]
+        if cache_key is not None and not force_reload:
+            with self._lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                if self.verbose:
+                    logger.info(f"Loading {table_name} from cache")
+                return cached
 
         # Find Parquet file
         parquet_path = self.config.paths.parquet_dir / f"{table_name}.parquet"
@@ -54,49 +155,85 @@ class ParquetLoader:
         if not parquet_path.exists():
             raise FileNotFoundError(f"Parquet file not found: {parquet_path}")
 
-        # Load
+        # Load: memory-map the file and decode row groups on all cores
         start_time = datetime.now()
-        df = pd.read_parquet(parquet_path)
+        with pa.memory_map(str(parquet_path), 'r') as source:
+            table = pq.read_table(
+                source, columns=columns, filters=filters, use_threads=True, pre_buffer=True
+            )
         load_time = (datetime.now() - start_time).total_seconds()
 
-        # Log stats
-        file_size_mb = parquet_path.stat().st_size / (1024 * 1024)
-        memory_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+        # Log stats, only gathered when someone will see them
+        file_size_mb = memory_mb = None
+        if self.verbose or self.track_memory:
+            file_size_mb = parquet_path.stat().st_size / (1024 * 1024)
+            memory_mb = table.nbytes / (1024 * 1024)
 
         if self.verbose:
             logger.info(
                 f"Loaded {table_name}: "
-                f"{len(df):,} rows, {len(df.columns)} cols, "
+                f"{table.num_rows:,} rows, {table.num_columns} cols, "
                 f"{file_size_mb:.2f} MB on disk, {memory_mb:.2f} MB in memory, "
                 f"{load_time:.2f}s"
             )
 
-        # Record load history
-        self.load_history.append({
-            'table_name': table_name,
-            'timestamp': datetime.now(),
-            'rows': len(df),
-            'columns': len(df.columns),
-            'file_size_mb': file_size_mb,
-            'memory_mb': memory_mb,
-            'load_time_sec': load_time
-        })
-
-        # Cache if enabled
-        if self.cache_enabled:
-            self._cache[table_name] = df
+        with self._lock:
+            # Record load history
+            self.load_history.append({
+                'table_name': table_name,
+                'timestamp': datetime.now(),
+                'rows': table.num_rows,
+                'columns': table.num_columns,
+                'file_size_mb': file_size_mb,
+                'memory_mb': memory_mb,
+                'load_time_sec': load_time
+            })
+
+            # Cache if enabled
+            if cache_key is not None:
+                self._cache_put(cache_key, table)
+
+        return table
+
+    def _cache_put(self, key: tuple, table: pa.Table):
+        """
+        Insert a table into the cache, evicting least recently used tables over budget.
 
-        return df
+        The caller holds the lock.
+        """
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= previous.nbytes
+
+        self._cache[key] = table
+        self._cache_bytes += table.nbytes
+
+        if self.max_cache_bytes is None:
+            return
+
+        # Always keep the table just loaded, even if it alone exceeds the budget
+        while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+            (evicted_name, *_), evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+            logger.debug(
+                f"Evicted {evicted_name} from cache ({evicted.nbytes / (1024 * 1024):.2f} MB)"
+            )
 
     def load_all(
         self,
-        table_names: Optional[List[str]] = None
+        table_names: Optional[List[str]] = None,
+        max_workers: int = 8,
+        filters: Optional[List[Any]] = None
     ) -> Dict[str, pd.DataFrame]:
         """
         Load multiple tables.
 
         Args:
             table_names: Optional list of table names. If None, loads all available.
+            max_workers: Maximum number of tables loaded concurrently (pyarrow
+                releases the GIL while decoding)
+            filters: Optional pyarrow row filters applied to every table (see
+                :meth:`load_table`); each table must contain the filtered columns
 
         Returns:
             Dict mapping table names to DataFrames
@@ -111,12 +248,18 @@ class ParquetLoader:
             table_names = [f.stem for f in parquet_files]
 
         tables = {}
-        for table_name in table_names:
-            try:
-                tables[table_name] = self.load_table(table_name)
-            except FileNotFoundError as e:
-                logger.warning(f"Skipping {table_name}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=max(1, min(len(table_names), max_workers))) as executor:
+            futures = {
+                name: executor.submit(self.load_table, name, filters=filters)
+                for name in table_names
+            }
+
+            for table_name, future in futures.items():
+                try:
+                    tables[table_name] = future.result()
+                except FileNotFoundError as e:
+                    logger.warning(f"Skipping {table_name}: {e}")
+                    continue
 
         logger.success(f"Loaded {len(tables)} tables")
         return tables
@@ -124,6 +267,7 @@ class ParquetLoader:
     def clear_cache(self):
         """Clear the in-memory cache."""
         self._cache.clear()
+        self._cache_bytes = 0
         logger.info("Cache cleared")
 
     def get_load_summary(self) -> pd.DataFrame:
@@ -142,7 +286,8 @@ class ParquetLoader:
 def load_data(
     table_names: Optional[List[str]] = None,
     config_path: Optional[Path] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    filters: Optional[List[Tuple]] = None
 ) -> Dict[str, pd.DataFrame]:
     """
     Convenience function to load MOVR data.
@@ -151,6 +296,8 @@ def load_data(
         table_names: Optional list of specific tables to load
         config_path: Optional path to config file
         verbose: Enable verbose logging
+        filters: Optional pyarrow row filters (e.g. ``[('dstype', '==', 'ALS')]``)
+            pushed down to Parquet row-group statistics for every table
 
     Returns:
         Dict mapping table names to DataFrames
@@ -160,4 +307,4 @@ def load_data(
         get_config(config_path=config_path, reload=True)
 
     loader = ParquetLoader(verbose=verbose)
-    return loader.load_all(table_names=table_names)
+    return loader.load_all(table_names=table_names, filters=filters)
@@ -4,9 +4,13 @@ Data wrangling pipeline orchestration.
 Executes transformation rules defined in YAML configuration.
 """
 
+import json
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from loguru import logger
 
 from movr.config import get_config
@@ -14,6 +18,68 @@ from movr.wrangling.rules import RuleInterpreter
 from movr.wrangling.plugins import PluginLoader
 from movr.data.audit import AuditLogger
 
+# Rules hand frames through unchanged where they can and rely on Copy-on-Write
+# to defer copies to real writes. It is always on from pandas 3; opt in on 2.x.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Actions the "arrow" backend runs as Arrow compute kernels; the rest use pandas
+_ARROW_ACTIONS = frozenset({'drop_duplicates', 'parse_dates', 'validate_range'})
+
+
+def _mark_datetime_columns(table: pa.Table, columns: list) -> pa.Table:
+    """Update stored pandas metadata so parsed columns convert back as datetimes."""
+    metadata = table.schema.metadata or {}
+    if not columns or b'pandas' not in metadata:
+        return table
+
+    pandas_metadata = json.loads(metadata[b'pandas'])
+    for entry in pandas_metadata['columns']:
+        if entry['name'] in columns:
+            entry.update(pandas_type='datetime', numpy_type='datetime64[us]', metadata=None)
+    return table.replace_schema_metadata({**metadata, b'pandas': json.dumps(pandas_metadata)})
+
+
+def _parse_dates(values: pd.Series, formats: list, on_error: str) -> pd.Series:
+    """
+    Parse a column of dates, decoding each distinct value once.
+
+    A single declared format is applied strictly. With several formats, string
+    values are tried against each in order and anything still unparsed falls
+    back to pandas format inference.
+    """
+    codes, uniques = pd.factorize(values)
+    if len(uniques) == 0:
+        return pd.to_datetime(values, errors=on_error)
+
+    if len(formats) == 1:
+        parsed = pd.to_datetime(uniques, errors=on_error, format=formats[0])
+    elif formats and pd.api.types.infer_dtype(uniques, skipna=True) == 'string':
+        parsed = pd.to_datetime(uniques, errors='coerce', format=formats[0])
+        for fmt in formats[1:]:
+            missing = parsed.isna()
+            if not missing.any():
+                break
+            parsed = parsed.where(~missing, pd.to_datetime(uniques, errors='coerce', format=fmt))
+
+        missing = parsed.isna()
+        if missing.any():
+            rest = pd.to_datetime(uniques[missing], errors=on_error)
+            if isinstance(rest, pd.DatetimeIndex) and rest.tz is None:
+                # Inference may pick a coarser unit (e.g. all-NaT leftovers)
+                rest = rest.as_unit(parsed.unit)
+            if rest.dtype != parsed.dtype:
+                return pd.to_datetime(values, errors=on_error)
+            filled = parsed.to_numpy(copy=True)
+            filled[missing] = rest.to_numpy()
+            parsed = pd.DatetimeIndex(filled)
+    else:
+        parsed = pd.to_datetime(uniques, errors=on_error)
+
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=values.index, name=values.name
+    )
+
 
 class WranglingPipeline:
     """Execute data wrangling rules on tables."""
@@ -22,7 +88,8 @@ class WranglingPipeline:
         self,
         rules_file: Optional[Path] = None,
         strictness: Optional[str] = None,
-        audit_logger: Optional[AuditLogger] = None
+        audit_logger: Optional[AuditLogger] = None,
+        backend: str = "pandas"
     ):
         """
         Initialize wrangling pipeline.
@@ -31,34 +98,56 @@ class WranglingPipeline:
             rules_file: Path to YAML rules file
             strictness: Override strictness mode (strict/permissive/interactive)
             audit_logger: Optional audit logger
+            backend: "pandas", or "arrow" to run deduplication, date parsing and
+                range validation as Arrow compute kernels. Tables stay in Arrow
+                between such rules and are converted to pandas only when a
+                pandas-only rule needs them, or at the end of the pipeline.
+                The arrow backend parses dates strictly against the rule's
+                declared formats rather than inferring them.
         """
+        if backend not in ("pandas", "arrow"):
+            raise ValueError(f"Unknown backend: {backend}")
+
         self.config = get_config()
         self.rules_file = rules_file or Path("config/wrangling_rules.yaml")
         self.strictness = strictness or self.config.wrangling.strictness
         self.audit = audit_logger or AuditLogger()
+        self.backend = backend
+        self._source_dtypes: Dict[str, pd.Series] = {}
 
         self.rules = RuleInterpreter(self.rules_file)
         self.plugins = PluginLoader()
 
-    def execute(self, tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    def execute(self, tables: Dict[str, Union[pd.DataFrame, pa.Table]]) -> Dict[str, pd.DataFrame]:
         """
         Execute all wrangling rules on tables.
 
         Args:
-            tables: Dict mapping table names to DataFrames
+            tables: Dict mapping table names to DataFrames (or pyarrow Tables)
 
         Returns:
             Dict of cleaned DataFrames
         """
         logger.info(f"Starting wrangling pipeline in {self.strictness} mode")
-        results = tables.copy()
-
-        for rule in self.rules.get_rules():
-            rule_name = rule.get('name', 'unnamed')
-            tables_to_process = self._get_tables_for_rule(rule, results.keys())
-
+        results = dict(tables)
+        self._source_dtypes = {}
+
+        # Rules never add or remove tables, so resolve each rule's targets once
+        table_names = list(results)
+        available = set(table_names)
+        plan = [
+            (
+                rule,
+                rule.get('name', 'unnamed'),
+                self._get_tables_for_rule(rule, table_names, available),
+            )
+            for rule in self.rules.get_rules()
+        ]
+
+        for rule, rule_name, tables_to_process in plan:
             if not tables_to_process:
                 continue
+            details = {'rule': rule}
 
             logger.info(f"Applying rule: {rule_name}")
 
@@ -68,7 +157,7 @@ class WranglingPipeline:
                     rows_before = len(df)
 
                     # Apply rule
-                    df_clean = self._apply_rule(rule, df, table_name)
+                    df_clean = self._apply(rule, df, table_name)
                     rows_after = len(df_clean)
 
                     results[table_name] = df_clean
@@ -79,7 +168,7 @@ class WranglingPipeline:
                         rule_name=rule_name,
                         rows_before=rows_before,
                         rows_after=rows_after,
-                        details={'rule': rule}
+                        details=details
                     )
 
                     if rows_before != rows_after:
@@ -91,17 +180,156 @@ class WranglingPipeline:
                 except Exception as e:
                     self._handle_error(rule_name, table_name, e)
 
+        # Materialize to pandas at the pipeline boundary
+        results = {name: self._to_pandas(table, name) for name, table in results.items()}
+
         logger.success("Wrangling pipeline complete")
         return results
 
-    def _get_tables_for_rule(self, rule: dict, available_tables) -> list:
+    def _get_tables_for_rule(
+        self, rule: dict, table_names: list, available: Optional[set] = None
+    ) -> list:
         """Determine which tables a rule applies to."""
         rule_tables = rule.get('tables', [])
 
-        if 'all' in rule_tables or rule_tables == ['all']:
-            return list(available_tables)
+        if 'all' in rule_tables:
+            return list(table_names)
+
+        available = available if available is not None else set(table_names)
+        return [t for t in rule_tables if t in available]
+
+    def _apply(
+        self,
+        rule: dict,
+        data: Union[pd.DataFrame, pa.Table],
+        table_name: str
+    ) -> Union[pd.DataFrame, pa.Table]:
+        """Apply a rule on the configured backend, converting the table only when needed."""
+        if self.backend == "arrow" and rule.get('action') in _ARROW_ACTIONS:
+            try:
+                # Keep the index (including a default RangeIndex) as a column so
+                # dropped rows leave the surviving labels intact
+                if isinstance(data, pd.DataFrame):
+                    table = pa.Table.from_pandas(data, preserve_index=True)
+                    self._source_dtypes[table_name] = data.dtypes
+                else:
+                    table = data
+                return self._apply_rule_arrow(rule, table)
+            except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                logger.debug(f"Arrow kernel unavailable for {table_name}, using pandas: {e}")
+
+        df = self._to_pandas(data, table_name)
+        return self._apply_rule(rule, df, table_name)
+
+    def _to_pandas(self, data: Union[pd.DataFrame, pa.Table], table_name: str) -> pd.DataFrame:
+        """Convert an Arrow table back to pandas, restoring object columns it came from."""
+        if not isinstance(data, pa.Table):
+            return data
+
+        df = data.to_pandas()
+        # Arrow strings come back as the pandas string dtype (missing as NaN);
+        # hand object columns back as objects with None, like the pandas backend
+        source_dtypes = self._source_dtypes.get(table_name)
+        if source_dtypes is not None:
+            restored = {
+                col: pd.Series(
+                    data[col].to_numpy(zero_copy_only=False), index=df.index, dtype=object
+                )
+                for col, dtype in source_dtypes.items()
+                if dtype == object and col in df.columns
+                and df[col].dtype != object and pd.api.types.is_string_dtype(df[col].dtype)
+            }
+            if restored:
+                df = df.assign(**restored)
+        return df
+
+    def _apply_rule_arrow(self, rule: dict, table: pa.Table) -> pa.Table:
+        """Apply a deduplication, date parsing or range validation rule to an Arrow table."""
+        action = rule.get('action')
+
+        if action == 'drop_duplicates':
+            subset = rule.get('subset', None)
+            keep = rule.get('keep', 'first')
+            if subset is None:
+                # Like pandas, compare data columns only, not a stored index
+                index_columns = (table.schema.pandas_metadata or {}).get('index_columns', [])
+                subset = [c for c in table.column_names if c not in index_columns]
+
+            # Group on the subset, tracking each group's first/last row and size
+            row_ids = pa.array(np.arange(table.num_rows, dtype=np.int64))
+            groups = (
+                table.select(subset)
+                .append_column('__row__', row_ids)
+                .group_by(subset, use_threads=False)
+                .aggregate([('__row__', 'min'), ('__row__', 'max'), ('__row__', 'count')])
+            )
+            if len(groups) == table.num_rows:
+                return table
+
+            if keep == 'first':
+                rows = groups['__row___min']
+            elif keep == 'last':
+                rows = groups['__row___max']
+            else:
+                rows = groups['__row___min'].filter(pc.equal(groups['__row___count'], 1))
+            # Keep surviving rows in their original order
+            return table.take(pc.take(rows, pc.sort_indices(rows)))
+
+        elif action == 'parse_dates':
+            columns = rule.get('columns', [])
+            formats = rule.get('formats', ['%Y-%m-%d'])
+            on_error = rule.get('on_error', 'coerce')
+
+            parsed_columns = []
+            for col in columns:
+                if col not in table.column_names:
+                    continue
+                values = table[col]
+                if pa.types.is_timestamp(values.type):
+                    continue
+                if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+                    values = values.cast(pa.string())
+
+                # First declared format that matches wins
+                parsed = pc.coalesce(*[
+                    pc.strptime(values, format=fmt, unit='us', error_is_null=True)
+                    for fmt in formats
+                ])
+                if on_error == 'raise':
+                    failed = pc.sum(pc.and_(pc.is_valid(values), pc.is_null(parsed))).as_py()
+                    if failed:
+                        raise ValueError(f"{failed} values in {col} do not match {formats}")
+
+                table = table.set_column(table.schema.get_field_index(col), col, parsed)
+                parsed_columns.append(col)
+
+            return _mark_datetime_columns(table, parsed_columns)
+
+        elif action == 'validate_range':
+            column = rule.get('column')
+            min_val = rule.get('min')
+            max_val = rule.get('max')
+            on_error = rule.get('on_error', 'flag')
+
+            if column in table.column_names:
+                # Missing values compare False, as in pandas
+                out_of_range = pc.fill_null(
+                    pc.or_(pc.less(table[column], min_val), pc.greater(table[column], max_val)),
+                    False
+                )
 
-        return [t for t in rule_tables if t in available_tables]
+                if on_error == 'flag':
+                    table = table.append_column(f'{column}_OUT_OF_RANGE', out_of_range)
+                elif on_error == 'drop':
+                    table = table.filter(pc.invert(out_of_range))
+                elif on_error == 'raise' and pc.any(out_of_range).as_py():
+                    raise ValueError(
+                        f"{pc.sum(out_of_range).as_py()} values out of range in {column}"
+                    )
+
+            return table
+
+        raise ValueError(f"Action not supported by the arrow backend: {action}")
 
     def _apply_rule(self, rule: dict, df: pd.DataFrame, table_name: str) -> pd.DataFrame:
         """Apply a single rule to a DataFrame."""
@@ -110,31 +338,42 @@ class WranglingPipeline:
         if action == 'drop_duplicates':
             subset = rule.get('subset', None)
             keep = rule.get('keep', 'first')
-            return df.drop_duplicates(subset=subset, keep=keep)
+            # Already-unique tables (e.g. idempotent re-runs) pass through uncopied
+            duplicated = df.duplicated(subset=subset, keep=keep)
+            return df[~duplicated] if duplicated.any() else df
 
         elif action == 'parse_dates':
             columns = rule.get('columns', [])
             formats = rule.get('formats', ['%Y-%m-%d'])
             on_error = rule.get('on_error', 'coerce')
 
-            for col in columns:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors=on_error)
-            return df
+            # Columns that are already datetimes are left alone
+            parsed = {
+                col: _parse_dates(df[col], formats, on_error)
+                for col in columns
+                if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])
+            }
+            return df.assign(**parsed) if parsed else df
 
         elif action == 'replace_missing':
             values = rule.get('values', [])
             replace_with = rule.get('replace_with', None)
+            # Nothing to replace (dict/scalar values go straight to replace)
+            if isinstance(values, (list, tuple)) and not df.isin(values).to_numpy().any():
+                return df
             return df.replace(values, replace_with)
 
         elif action == 'enforce_dtype':
             columns = rule.get('columns', [])
             dtype = rule.get('dtype', 'string')
 
-            for col in columns:
-                if col in df.columns:
-                    df[col] = df[col].astype(dtype)
-            return df
+            # Plain "string" is stored arrow-backed; cast all columns in one pass,
+            # skipping those already of the target dtype (e.g. on re-runs)
+            if dtype == 'string':
+                dtype = 'string[pyarrow]'
+            target = pd.api.types.pandas_dtype(dtype)
+            pending = [col for col in columns if col in df.columns and df[col].dtype != target]
+            return df.astype({col: target for col in pending}) if pending else df
 
         elif action == 'validate_range':
             column = rule.get('column')
@@ -146,7 +385,7 @@ class WranglingPipeline:
                 out_of_range = (df[column] < min_val) | (df[column] > max_val)
 
                 if on_error == 'flag':
-                    df[f'{column}_OUT_OF_RANGE'] = out_of_range
+                    df = df.assign(**{f'{column}_OUT_OF_RANGE': out_of_range})
                 elif on_error == 'drop':
                     df = df[~out_of_range]
                 elif on_error == 'raise' and out_of_range.any():
@@ -43,6 +43,10 @@ class PluginLoader:
         """
         self.plugin_dir = plugin_dir or Path("plugins")
         self.loaded_modules: Dict[str, Any] = {}
+        # Modification time of each discovered file when it was last executed
+        self._module_mtimes: Dict[str, float] = {}
+        # Resolved plugin functions by import path
+        self._plugin_cache: Dict[str, Callable] = {}
 
     def load_plugin(self, plugin_path: str) -> Callable:
         """
@@ -54,9 +58,11 @@ class PluginLoader:
         Returns:
             Callable plugin function
         """
-        # Check if already registered
+        # Check if already registered or resolved
         if plugin_path in _PLUGIN_REGISTRY:
             return _PLUGIN_REGISTRY[plugin_path]
+        if plugin_path in self._plugin_cache:
+            return self._plugin_cache[plugin_path]
 
         # Try to import from path
         parts = plugin_path.split('.')
@@ -71,6 +77,7 @@ class PluginLoader:
             module = importlib.import_module(module_path)
             func = getattr(module, function_name)
             logger.info(f"Loaded plugin: {plugin_path}")
+            self._plugin_cache[plugin_path] = func
             return func
         except (ImportError, AttributeError) as e:
             logger.error(f"Failed to load plugin {plugin_path}: {e}")
@@ -93,6 +100,11 @@ class PluginLoader:
             if py_file.name.startswith("_"):
                 continue
 
+            # Unchanged files have already been executed
+            mtime = py_file.stat().st_mtime
+            if py_file.stem in self.loaded_modules and mtime <= self._module_mtimes[py_file.stem]:
+                continue
+
             try:
                 # Load module
                 spec = importlib.util.spec_from_file_location(py_file.stem, py_file)
@@ -100,6 +112,7 @@ class PluginLoader:
                 spec.loader.exec_module(module)
 
                 self.loaded_modules[py_file.stem] = module
+                self._module_mtimes[py_file.stem] = mtime
                 logger.info(f"Discovered plugins in: {py_file.name}")
 
             except Exception as e:
@@ -0,0 +1,10 @@
+"""Inspect script surfaces without importing them."""
+
+import ast
+from pathlib import Path
+
+
+def top_level_defs(path):
+    """Return the names of functions defined at module level in ``path``."""
+    tree = ast.parse(Path(path).read_bytes())
+    return {n.name for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))}
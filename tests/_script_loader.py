@@ -0,0 +1,28 @@
+"""Load scripts/*.py as modules, at most once per interpreter."""
+
+import functools
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+
+
+@functools.cache
+def load_script(path_str: str) -> types.ModuleType:
+    """Execute the script at ``path_str`` and register it in sys.modules under its stem."""
+    name = Path(path_str).stem
+    # SourceFileLoader reads and writes __pycache__, so later runs skip compilation
+    loader = importlib.machinery.SourceFileLoader(name, path_str)
+    spec = importlib.util.spec_from_loader(name, loader)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        loader.exec_module(mod)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    return mod
@@ -0,0 +1,58 @@
+"""Shared fixtures for the test suite."""
+
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests._script_loader import SCRIPTS_DIR, load_script
+
+
+# Fixture columns as ready-made arrays so DataFrame construction skips inference
+_FAKE_DEMOGRAPHICS = {
+    'FACPATID': np.array([1, 2, 3]),
+    'dstype': pd.Categorical(['DMD', 'DMD', 'SMA']),
+    'usndr': np.array([False, False, False]),
+    'gender': pd.Categorical(['M', 'M', 'F']),
+    'dob': pd.to_datetime(
+        ['2000-01-01', '2010-01-01', '2015-01-01'], format='%Y-%m-%d', errors='coerce'
+    ),
+}
+
+_DEMO_SOA = {
+    'FACPATID': np.array(['P1', 'P2', 'P3', 'P4'], dtype=object),
+    'GENDER': pd.Categorical(['Male', 'Female', 'Female', 'Male'], categories=['Male', 'Female']),
+    'dob': pd.to_datetime(
+        ['2010-01-01', '1980-06-15', None, '2005-03-20'], format='%Y-%m-%d', errors='coerce'
+    ),
+    'DISEASE': pd.Categorical(['DMD', 'DMD', 'BMD', 'ALS']),
+    'REGISTRY': pd.Categorical(['USNDR', None, 'MOVR', 'USNDR']),
+}
+
+
+@pytest.fixture(scope="session")
+def exploratory_interpreter_mod():
+    return load_script(str(SCRIPTS_DIR / 'exploratory_interpreter.py'))
+
+
+@pytest.fixture(scope="session")
+def make_exploratory_cohort_mod():
+    return load_script(str(SCRIPTS_DIR / 'make_exploratory_cohort.py'))
+
+
+@pytest.fixture(scope="session")
+def fake_tables():
+    """Minimal tables satisfying EnrollmentValidator (read-only, shared)."""
+    ids = np.array([1, 2, 3])
+    return MappingProxyType({
+        'demographics_maindata': pd.DataFrame(_FAKE_DEMOGRAPHICS, copy=False),
+        'diagnosis_maindata': pd.DataFrame({'FACPATID': ids}, copy=False),
+        'encounter_maindata': pd.DataFrame({'FACPATID': ids}, copy=False),
+    })
+
+
+@pytest.fixture(scope="session")
+def demo_df():
+    """Demographics table with upper-case column aliases (read-only, shared)."""
+    return pd.DataFrame(_DEMO_SOA, copy=False)
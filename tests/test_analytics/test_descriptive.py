@@ -1,25 +1,24 @@
 import pandas as pd
+import pytest
 from movr.analytics.descriptive import DescriptiveAnalyzer
+from movr.cohorts.manager import CohortManager
 
 
-def make_demo_table():
-    return pd.DataFrame({
-        'FACPATID': ['P1', 'P2', 'P3', 'P4'],
-        'GENDER': ['Male', 'Female', 'Female', 'Male'],
-        'dob': ['2010-01-01', '1980-06-15', None, '2005-03-20'],
-        'DISEASE': ['DMD', 'DMD', 'BMD', 'ALS'],
-        'REGISTRY': ['USNDR', None, 'MOVR', 'USNDR']
-    })
-
-
-def test_descriptive_resolves_columns_and_age(tmp_path):
+@pytest.mark.parametrize("use_manager", [False, True])
+def test_descriptive(demo_df, use_manager):
+    tables = {'demographics_maindata': demo_df.copy(deep=False)}
     # cohort contains the patient ids
     cohort = pd.DataFrame({'FACPATID': ['P1', 'P2', 'P3', 'P4']})
 
-    demo = make_demo_table()
-    tables = {'demographics_maindata': demo}
-
-    analyzer = DescriptiveAnalyzer(cohort=cohort, tables=tables)
+    if use_manager:
+        # analyzer should use CohortManager.get_cohort_data
+        cm = CohortManager(tables)
+        cm._cohorts['base'] = cohort
+        analyzer = DescriptiveAnalyzer(
+            cohort=None, tables=tables, cohort_manager=cm, cohort_name='base'
+        )
+    else:
+        analyzer = DescriptiveAnalyzer(cohort=cohort, tables=tables)
     result = analyzer.run_analysis()
 
     # basic expectations
@@ -43,24 +42,3 @@ def test_descriptive_resolves_columns_and_age(tmp_path):
     assert cols.get('gender') in ('GENDER', 'gender')
     assert cols.get('disease') in ('DISEASE', 'dstype')
     assert cols.get('registry') in ('REGISTRY', 'usndr')
-
-
-def test_descriptive_uses_cohort_manager_prepared(tmp_path):
-    # Create demo tables and cohort manager
-    from movr.cohorts.manager import CohortManager
-
-    demo = make_demo_table()
-    tables = {'demographics_maindata': demo}
-
-    # create cohort manager and a base cohort (we'll create cohort manually)
-    cm = CohortManager(tables)
-    cm._cohorts['base'] = pd.DataFrame({'FACPATID': ['P1', 'P2', 'P3', 'P4']})
-
-    # analyzer should use CohortManager.get_cohort_data
-    analyzer = DescriptiveAnalyzer(cohort=None, tables=tables, cohort_manager=cm, cohort_name='base')
-    result = analyzer.run_analysis()
-
-    assert result.summary['n_patients'] == 4
-    # columns_used should reflect resolved names
-    cols = result.metadata.get('columns_used', {})
-    assert cols.get('gender') in ('GENDER', 'gender')
@@ -0,0 +1,188 @@
+import sys
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from movr.cli.commands import summary
+
+
+def _fake_tables():
+    demographics = pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P3', 'P4', 'P5'],
+        'dstype': ['DMD', 'DMD', 'SMA', 'ALS', 'SMA'],
+        'usndr': [None, 0, 1, '', 'Yes'],
+        'enroldt': ['2019-01-10', '2020-03-05', '2020-07-21', None, '2021-02-02'],
+    })
+    encounter = pd.DataFrame({
+        'FACPATID': ['P1', 'P1', 'P2', 'P3', 'P4', 'P5', 'P5'],
+        'encntdt': ['2019-02-01', '2020-02-01', '2020-04-01', '2020-08-01',
+                    '2021-01-01', '2021-03-01', '2021-06-01'],
+    })
+    return {
+        'demographics_maindata': demographics,
+        'encounter_maindata': encounter,
+    }
+
+
+def _reporter(monkeypatch, registry, tables=None):
+    tables = _fake_tables() if tables is None else tables
+    monkeypatch.setattr(summary, 'load_data', lambda **kwargs: tables)
+    reporter = summary.SummaryReporter(registry=registry)
+    assert reporter.load_data()
+    return reporter
+
+
+def test_filter_by_registry_splits_usndr(monkeypatch):
+    datahub = _reporter(monkeypatch, 'datahub')
+    usndr = _reporter(monkeypatch, 'usndr')
+    everyone = _reporter(monkeypatch, 'all')
+
+    # empty/null/0 = DataHub, anything else = USNDR
+    datahub_ids = datahub.filter_by_registry(datahub.demographics)['FACPATID'].tolist()
+    assert datahub_ids == ['P1', 'P2', 'P4']
+    assert usndr.filter_by_registry(usndr.demographics)['FACPATID'].tolist() == ['P3', 'P5']
+    assert len(everyone.filter_by_registry(everyone.demographics)) == 5
+
+
+def test_enrollment_by_disease(monkeypatch):
+    reporter = _reporter(monkeypatch, 'datahub')
+
+    enrollment = reporter.get_enrollment_by_disease()
+
+    assert enrollment.to_dict() == {'ALS': 1, 'DMD': 2}
+
+
+def test_disease_year_metrics_skip_unobserved_diseases(monkeypatch):
+    reporter = _reporter(monkeypatch, 'datahub')
+
+    encounters = reporter.get_encounters_by_disease_year()
+
+    # SMA patients are all USNDR, so no zero-filled SMA rows should appear
+    assert set(encounters['Disease']) == {'ALS', 'DMD'}
+    assert (encounters['Encounters'] > 0).all()
+
+
+def test_compute_metrics_matches_direct_calls(monkeypatch):
+    reporter = _reporter(monkeypatch, 'datahub')
+
+    results = reporter.compute_metrics(list(summary.SummaryReporter.METRICS))
+
+    pd.testing.assert_series_equal(results['enrollment'], reporter.get_enrollment_by_disease())
+    assert results['encounter_summary'] == reporter.get_encounter_summary()
+    pd.testing.assert_frame_equal(
+        results['avg_encounters'], reporter.get_avg_encounters_per_participant_disease()
+    )
+
+
+def test_compute_metrics_parses_dates_on_caller_thread(monkeypatch):
+    reporter = _reporter(monkeypatch, 'datahub')
+    threads = []
+    catch_warnings = warnings.catch_warnings
+
+    def recording_catch_warnings(*args, **kwargs):
+        # pandas enters catch_warnings internally too; only record the reporter's own
+        if sys._getframe(1).f_globals.get('__name__') == summary.__name__:
+            threads.append(threading.current_thread())
+        return catch_warnings(*args, **kwargs)
+
+    monkeypatch.setattr(summary.warnings, 'catch_warnings', recording_catch_warnings)
+    results = reporter.compute_metrics(list(summary.SummaryReporter.METRICS))
+
+    assert threads and set(threads) == {threading.current_thread()}
+    pd.testing.assert_frame_equal(results['recruitment'], reporter.get_annual_recruitment())
+
+
+def _as_object(df, columns):
+    """Compare categorical results by value."""
+    return df[columns].astype({col: object for col in columns if col != 'visit'})
+
+
+def test_attach_disease_matches_left_merge(monkeypatch):
+    encounter = pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P9', 'P3', 'P1'],
+        'usndr': [None, None, 0, 1, None],
+        'visit': [1, 2, 3, 4, 5],
+    })
+    demographics = pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P3'],
+        'dstype': ['DMD', None, 'SMA'],
+        'usndr': [None, None, None],
+    })
+    duplicated = pd.concat([
+        demographics,
+        pd.DataFrame({'FACPATID': ['P1'], 'dstype': ['BMD'], 'usndr': [None]}),
+    ], ignore_index=True)
+    columns = ['FACPATID', 'visit', 'dstype']
+
+    # One demographics row per participant: code lookup; P3's USNDR encounter is filtered out
+    reporter = _reporter(monkeypatch, 'datahub', {
+        'demographics_maindata': demographics, 'encounter_maindata': encounter,
+    })
+    expected = pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P9', 'P1'],
+        'visit': [1, 2, 3, 5],
+        'dstype': ['DMD', np.nan, np.nan, 'DMD'],
+    }, dtype=object).astype({'visit': 'int64'})
+    result = reporter._encounter_with_disease
+    assert isinstance(result['dstype'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(_as_object(result, columns), expected)
+
+    # Duplicate demographics ids: merge fallback repeats the encounter per match
+    reporter = _reporter(monkeypatch, 'datahub', {
+        'demographics_maindata': duplicated, 'encounter_maindata': encounter,
+    })
+    expected = pd.DataFrame({
+        'FACPATID': ['P1', 'P1', 'P2', 'P9', 'P1', 'P1'],
+        'visit': [1, 1, 2, 3, 5, 5],
+        'dstype': ['DMD', 'BMD', np.nan, np.nan, 'DMD', 'BMD'],
+    }, dtype=object).astype({'visit': 'int64'})
+    pd.testing.assert_frame_equal(
+        _as_object(reporter._encounter_with_disease, columns), expected
+    )
+
+
+def test_avg_encounters_per_disease_year_values(monkeypatch):
+    reporter = _reporter(monkeypatch, 'all', {
+        'demographics_maindata': pd.DataFrame({
+            'FACPATID': ['P1', 'P2', 'P3', 'P4'],
+            'dstype': ['DMD', 'DMD', 'SMA', None],
+        }),
+        'encounter_maindata': pd.DataFrame({
+            'FACPATID': ['P1', 'P1', 'P1', 'P2', 'P3', 'P3', 'P3', 'P4', 'P9'],
+            'encntdt': ['2019-01-01', '2019-05-01', '2020-01-01', '2019-03-01', '2020-02-01',
+                        '2020-03-01', None, '2019-01-01', '2019-06-01'],
+        }),
+    })
+
+    # Rows without a disease (P4, P9) or a date are dropped, as by the old groupby;
+    # DMD 2019 averages P1's two visits with P2's one
+    expected = pd.DataFrame({
+        'Disease': ['DMD', 'DMD', 'SMA'],
+        'Year': pd.array([2019, 2020, 2020], dtype='int16'),
+        'Avg Encounters/Participant': [1.5, 1.0, 2.0],
+    }).astype({'Disease': object})
+    result = reporter.get_avg_encounters_per_participant_disease_year()
+    pd.testing.assert_frame_equal(result.astype({'Disease': object}), expected)
+
+
+def test_filter_by_registry_classifies_registry_labels(monkeypatch):
+    labels = ['MOVR', 'movr datahub', 'USNDR', None, 'Other', 'DataHub/USNDR']
+    demographics = pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P3', 'P4', 'P5', 'P6'],
+        'dstype': ['DMD', 'SMA', 'ALS', 'DMD', 'SMA', 'ALS'],
+        'REGISTRY': labels,
+    })
+    # Frames not seen at load time resolve their own column
+    other = pd.DataFrame({'DATA_SOURCE': labels, 'value': range(6)}, index=range(10, 16))
+    expected_rows = {'datahub': [0, 1, 5], 'usndr': [2, 5], 'all': list(range(6))}
+
+    for registry, rows in expected_rows.items():
+        reporter = _reporter(monkeypatch, registry, {
+            'demographics_maindata': demographics,
+            'encounter_maindata': pd.DataFrame({'FACPATID': ['P1']}),
+        })
+        filtered = reporter.filter_by_registry(reporter.demographics)
+        assert filtered['FACPATID'].tolist() == [f'P{row + 1}' for row in rows]
+        pd.testing.assert_frame_equal(reporter.filter_by_registry(other), other.iloc[rows])
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from movr.cohorts.filters import FilterExpression
+
+
+def make_table():
+    return pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P3', 'P4'],
+        'AGE': [5.0, 17.5, 40.0, None],
+        'DISEASE': ['DMD', 'DMD', 'ALS', 'SMA'],
+    })
+
+
+def test_single_conditions():
+    df = make_table()
+
+    def matches(expr):
+        return expr.apply(df).tolist()
+
+    assert matches(FilterExpression('DISEASE').equals('DMD')) == [True, True, False, False]
+    als_sma = FilterExpression('DISEASE').in_list(['ALS', 'SMA'])
+    assert matches(als_sma) == [False, False, True, True]
+    assert matches(FilterExpression('AGE').between(0, 18)) == [True, True, False, False]
+    assert matches(FilterExpression('AGE').greater_than(10)) == [False, True, True, False]
+    assert matches(FilterExpression('DISEASE').contains('md')) == [True, True, False, False]
+
+
+def test_combined_conditions():
+    df = make_table()
+
+    pediatric = FilterExpression('AGE').between(0, 18)
+    pediatric_dmd = pediatric & FilterExpression('DISEASE').equals('DMD')
+    assert pediatric_dmd.apply(df).tolist() == [True, True, False, False]
+
+    als_or_young = FilterExpression('DISEASE').equals('ALS') | FilterExpression('AGE').less_than(10)
+    assert als_or_young.apply(df).tolist() == [True, False, True, False]
+
+    # contains() can't be compiled, so it is combined with the compiled side at apply time
+    mixed = FilterExpression('DISEASE').contains('S') & FilterExpression('AGE').greater_than(18)
+    assert mixed.apply(df).tolist() == [False, False, True, False]
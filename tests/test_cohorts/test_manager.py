@@ -0,0 +1,79 @@
+import pandas as pd
+
+from movr.cohorts.manager import CohortManager
+
+
+def _tables():
+    return {
+        'demographics_maindata': pd.DataFrame({
+            'FACPATID': ['P1', 'P2', 'P3', 'P4'],
+            'dstype': ['DMD', 'SMA', 'DMD', 'ALS'],
+            'usndr': [True, None, False, True],
+        }),
+        'diagnosis_maindata': pd.DataFrame({'FACPATID': ['P1', 'P2', 'P3']}),
+        'encounter_maindata': pd.DataFrame({'FACPATID': ['P1', 'P1', 'P3', 'P2', 'P9']}),
+    }
+
+
+def test_filtered_tables_follow_cohort():
+    tables = _tables()
+    cm = CohortManager(tables)
+
+    assert sorted(cm.create_base_cohort()['FACPATID']) == ['P1', 'P2', 'P3']
+    cm.filter_cohort('base', 'dmd', filters={'disease': 'DMD'})
+    filtered = cm.get_filtered_tables('dmd')
+
+    assert filtered['encounter_maindata']['FACPATID'].tolist() == ['P1', 'P1', 'P3']
+    assert filtered['diagnosis_maindata']['FACPATID'].tolist() == ['P1', 'P3']
+    # Caller's tables are not modified
+    assert tables['encounter_maindata']['FACPATID'].dtype != 'category'
+
+
+def test_filter_mask_non_scalar_operands_on_numeric_columns():
+    cm = CohortManager(_tables())
+    df = pd.DataFrame({'n': [1.0, 2.5], 'i': [1, 2], 'b': [True, False]})
+
+    # Strings and None fall back to the pandas comparison and match nothing
+    for resolved in (
+        [('n', 'n', '1')],
+        [('i', 'i', '2')],
+        [('b', 'b', 'True')],
+        [('n', 'n', {'min': None})],
+    ):
+        assert not cm._filter_mask(df, resolved).any()
+
+    assert cm._filter_mask(df, [('n', 'n', {'min': 2})]).tolist() == [False, True]
+    assert cm._filter_mask(df, [('b', 'b', True)]).tolist() == [True, False]
+
+
+def test_returned_frames_keep_facpatid_dtype():
+    ids = [f'P{i:02d}' for i in range(60)]
+    tables = {
+        'demographics_maindata': pd.DataFrame({
+            'FACPATID': ids,
+            'dstype': ['DMD' if i % 6 == 0 else 'SMA' for i in range(60)],
+        }),
+        'diagnosis_maindata': pd.DataFrame({'FACPATID': ids}),
+        'encounter_maindata': pd.DataFrame({'FACPATID': ids + ids}),
+    }
+    id_dtype = tables['encounter_maindata']['FACPATID'].dtype
+    cm = CohortManager(tables)
+    cm.create_base_cohort()
+    cm.filter_cohort('base', 'dmd', filters={'disease': 'DMD'})
+    cm.filter_cohort('base', 'custom', custom_filter=lambda df: df['FACPATID'] < 'P10')
+
+    encounters = cm.get_filtered_tables('dmd')['encounter_maindata']
+    counts = encounters['FACPATID'].value_counts()
+    assert len(counts) == 10 and (counts == 2).all()
+    assert len(encounters.groupby('FACPATID', observed=False).size()) == 10
+
+    assert cm.tables['encounter_maindata']['FACPATID'].dtype == id_dtype
+    assert encounters['FACPATID'].dtype == id_dtype
+    for frame in (
+        cm.get_cohort('base'),
+        cm.get_cohort('dmd'),
+        cm.get_cohort('custom'),
+        cm.get_cohort_data('dmd'),
+    ):
+        assert frame['FACPATID'].dtype == id_dtype
+    assert sorted(cm.get_cohort('custom')['FACPATID']) == ids[:10]
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from movr.cohorts.validation import EnrollmentValidator
+
+
+def _tables():
+    return {
+        'demographics_maindata': pd.DataFrame({'FACPATID': ['P1', 'P2', 'P3', 'P4']}),
+        'diagnosis_maindata': pd.DataFrame({'FACPATID': ['P1', 'P2', 'P2', 'P5']}),
+        'encounter_maindata': pd.DataFrame({'FACPATID': ['P2', 'P1', 'P3']}),
+    }
+
+
+def test_get_enrolled_patients_requires_all_forms():
+    validator = EnrollmentValidator(_tables())
+
+    assert sorted(validator.get_enrolled_patients()) == ['P1', 'P2']
+
+
+def test_validate_enrollment_report():
+    report = EnrollmentValidator(_tables()).validate_enrollment()
+
+    assert report['enrolled_count'] == 2
+    assert report['total_unique_patients'] == 5
+    assert report['form_counts'] == {
+        'demographics_maindata': 4,
+        'diagnosis_maindata': 3,
+        'encounter_maindata': 3,
+    }
+    assert report['missing_by_form'] == {
+        'demographics_maindata': 1,
+        'diagnosis_maindata': 2,
+        'encounter_maindata': 2,
+    }
@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from movr.data.audit import AuditLogger
+
+
+def _entries(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_flush_and_close_write_the_jsonl_trail(tmp_path):
+    audit = AuditLogger(tmp_path)
+    audit.log_transformation('demographics', 'dedupe', 5, 4, details={'rule': {'keep': 'first'}})
+    audit.flush()
+
+    log_file = tmp_path / f'audit_{audit.session_id}.jsonl'
+    assert [e['rows_removed'] for e in _entries(log_file)] == [1]
+
+    with audit:
+        audit.log_analysis('descriptive', 'base', 10)
+    assert [e['operation'] for e in _entries(log_file)] == ['transformation', 'analysis']
+    # Closing twice is harmless
+    audit.close()
+
+
+def test_unserializable_entry_raises_in_caller(tmp_path):
+    with AuditLogger(tmp_path) as audit:
+        with pytest.raises(TypeError):
+            audit.log_analysis(
+                'descriptive', 'base', np.int64(3), parameters={'dtype': np.dtype('int64')}
+            )
+
+
+def test_save_session_log_parquet(tmp_path):
+    with AuditLogger(tmp_path) as audit:
+        audit.log_transformation('demographics', 'dedupe', 5, 4, details={'subset': ['FACPATID']})
+        audit.log_analysis('descriptive', 'base', 4)
+        path = audit.save_session_log()
+
+    saved = pd.read_parquet(path)
+    assert path.suffix == '.parquet'
+    assert saved['operation'].tolist() == ['transformation', 'analysis']
+    assert (saved['session_id'] == audit.session_id).all()
+    assert json.loads(saved['details'][0]) == {'subset': ['FACPATID']}
+    assert saved['n_patients'].isna().tolist() == [True, False]
+
+
+def test_save_session_log_format_follows_filename(tmp_path):
+    with AuditLogger(tmp_path) as audit:
+        audit.log_analysis('descriptive', 'base', 4)
+
+        json_path = audit.save_session_log('session.json')
+        parquet_path = audit.save_session_log('session.parquet')
+        with pytest.raises(ValueError):
+            audit.save_session_log('session.json', format='parquet')
+
+    saved = json.loads(json_path.read_text())
+    assert saved['session_id'] == audit.session_id
+    assert [e['operation'] for e in saved['entries']] == ['analysis']
+    assert pd.read_parquet(parquet_path)['operation'].tolist() == ['analysis']
@@ -0,0 +1,85 @@
+import pandas as pd
+
+from movr.data.parquet_loader import ParquetLoader
+
+
+def _loader(monkeypatch, tmp_path):
+    pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P3'],
+        'dstype': ['DMD', 'SMA', 'DMD'],
+        'age': [4, 9, 12],
+    }).to_parquet(tmp_path / 'demographics_maindata.parquet', index=False)
+
+    loader = ParquetLoader(verbose=False)
+    monkeypatch.setattr(loader.config.paths, 'parquet_dir', tmp_path)
+    return loader
+
+
+def test_projected_reads_are_cached_separately(monkeypatch, tmp_path):
+    loader = _loader(monkeypatch, tmp_path)
+
+    projected = loader.load_table('demographics_maindata', columns=['dstype'])
+    full = loader.load_table('demographics_maindata')
+
+    assert list(projected.columns) == ['dstype']
+    assert list(full.columns) == ['FACPATID', 'dstype', 'age']
+    assert len(loader._cache) == 2
+    reloaded = loader.load_table('demographics_maindata', columns=['dstype'])
+    pd.testing.assert_frame_equal(reloaded, projected)
+
+
+def test_filters_are_pushed_to_reader(monkeypatch, tmp_path):
+    loader = _loader(monkeypatch, tmp_path)
+
+    dmd = loader.load_table('demographics_maindata', filters=[('dstype', '==', 'DMD')])
+
+    assert dmd['FACPATID'].tolist() == ['P1', 'P3']
+    assert len(loader.load_table('demographics_maindata')) == 3
+    # Filtered and full reads occupy separate cache slots
+    assert len(loader._cache) == 2
+
+
+def test_cache_evicts_least_recently_used(monkeypatch, tmp_path):
+    loader = _loader(monkeypatch, tmp_path)
+    ids = loader.load_table_arrow('demographics_maindata', columns=['FACPATID'])
+    loader.load_table_arrow('demographics_maindata', columns=['dstype'])
+    loader.load_table_arrow('demographics_maindata', columns=['FACPATID'])
+
+    # Room for the two most recently used tables only
+    age = ParquetLoader(cache_enabled=False, verbose=False).load_table_arrow(
+        'demographics_maindata', columns=['age']
+    )
+    loader.max_cache_bytes = ids.nbytes + age.nbytes
+    loader.load_table('demographics_maindata', columns=['age'])
+
+    assert list(loader._cache) == [
+        ('demographics_maindata', ('FACPATID',), None),
+        ('demographics_maindata', ('age',), None),
+    ]
+    assert loader._cache_bytes == loader.max_cache_bytes
+
+
+def test_load_all_skips_missing_tables(monkeypatch, tmp_path):
+    loader = _loader(monkeypatch, tmp_path)
+
+    tables = loader.load_all(['demographics_maindata', 'encounter_maindata'])
+
+    assert list(tables) == ['demographics_maindata']
+    assert len(loader.load_history) == 1
+
+
+def test_loaded_tables_are_writable(monkeypatch, tmp_path):
+    loader = _loader(monkeypatch, tmp_path)
+    uncached = ParquetLoader(cache_enabled=False, verbose=False)
+
+    for df in (loader.load_table('demographics_maindata'),
+               uncached.load_table('demographics_maindata'),
+               loader.load_all(['demographics_maindata'])['demographics_maindata']):
+        df.loc[0, 'age'] = 5
+        df.iloc[1, 2] = 10
+        df.loc[df['dstype'] == 'DMD', 'dstype'] = 'BMD'
+        assert df['age'].tolist() == [5, 10, 12]
+        assert df['dstype'].tolist() == ['BMD', 'SMA', 'BMD']
+
+    # Writes to a returned frame never reach the cached table
+    assert loader.load_table('demographics_maindata')['age'].tolist() == [4, 9, 12]
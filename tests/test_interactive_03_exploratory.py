@@ -1,15 +1,13 @@
-def test_interactive_03_helpers_exposed():
-    import importlib.util
-    from pathlib import Path
+from tests._ast_names import top_level_defs
+from tests._script_loader import SCRIPTS_DIR
 
-    script_path = Path(__file__).resolve().parents[1] / 'scripts' / 'interactive_03_exploratory.py'
-    spec = importlib.util.spec_from_file_location('interactive_03_exploratory', str(script_path))
-    m = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(m)
 
-    assert hasattr(m, 'cell_1_load_env')
-    assert hasattr(m, 'cell_2_create_cohorts')
-    assert hasattr(m, 'cell_3_compare_cohorts')
-    assert hasattr(m, 'run_all')
-    assert hasattr(m, 'start_repl')
-    assert hasattr(m, 'main')
+def test_interactive_03_helpers_exposed():
+    assert {
+        'cell_1_load_env',
+        'cell_2_create_cohorts',
+        'cell_3_compare_cohorts',
+        'run_all',
+        'start_repl',
+        'main',
+    } <= top_level_defs(SCRIPTS_DIR / 'interactive_03_exploratory.py')
@@ -1,35 +1,11 @@
-import importlib.util
-import sys
-from pathlib import Path
+def test_create_cohorts_programmatic(monkeypatch, exploratory_interpreter_mod, fake_tables):
+    ei = exploratory_interpreter_mod
 
-
-def _fake_tables():
-    import pandas as pd
-    demographics = pd.DataFrame({
-        'FACPATID': [1, 2],
-        'dstype': ['DMD', 'SMA'],
-        'usndr': [False, False],
-        'dob': ['2000-01-01', '2010-01-01']
-    })
-    diagnosis = pd.DataFrame({'FACPATID': [1, 2]})
-    encounter = pd.DataFrame({'FACPATID': [1, 2]})
-    return {
-        'demographics_maindata': demographics,
-        'diagnosis_maindata': diagnosis,
-        'encounter_maindata': encounter,
-    }
-
-
-# Load the module by path
-script_path = Path(__file__).parents[2] / 'scripts' / 'exploratory_interpreter.py'
-spec = importlib.util.spec_from_file_location('exploratory_interpreter', script_path)
-ei = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(ei)
-
-
-def test_create_cohorts_programmatic(monkeypatch):
     # Monkeypatch data loader used by the interpreter
-    monkeypatch.setattr(ei, 'load_data', lambda verbose=False: _fake_tables())
+    def load_fake(verbose=False):
+        return {k: v.copy(deep=False) for k, v in fake_tables.items()}
+
+    monkeypatch.setattr(ei, 'load_data', load_fake)
 
     # init env
     tables, cohorts = ei._init_env(verbose=False)
@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+import yaml
+
+from movr.data.audit import AuditLogger
+from movr.wrangling.pipeline import WranglingPipeline
+
+
+RULES = [
+    {
+        'name': 'missing', 'tables': ['all'], 'action': 'replace_missing',
+        'values': ['N/A'], 'replace_with': None,
+    },
+    {'name': 'dedupe', 'tables': ['all'], 'action': 'drop_duplicates', 'subset': ['FACPATID']},
+    {
+        'name': 'ids', 'tables': ['all'], 'action': 'enforce_dtype',
+        'columns': ['FACPATID'], 'dtype': 'string',
+    },
+    {
+        'name': 'dates', 'tables': ['all'], 'action': 'parse_dates',
+        'columns': ['enroldt'], 'formats': ['%Y-%m-%d'],
+    },
+    {
+        'name': 'age', 'tables': ['all'], 'action': 'validate_range',
+        'column': 'age', 'min': 0, 'max': 120,
+    },
+]
+
+
+def _pipeline(tmp_path, backend):
+    rules_file = tmp_path / 'rules.yaml'
+    rules_file.write_text(yaml.safe_dump({'rules': RULES}))
+    return WranglingPipeline(
+        rules_file=rules_file, audit_logger=AuditLogger(tmp_path / 'audit'), backend=backend
+    )
+
+
+@pytest.mark.parametrize("index", [[10, 11, 12, 13], None])
+def test_arrow_backend_matches_pandas(tmp_path, index):
+    demographics = pd.DataFrame({
+        'FACPATID': ['P1', 'P2', 'P1', None],
+        'enroldt': ['2020-01-02', 'bad', '2020-05-01', '2021-03-04'],
+        'age': [5, 130, 7, None],
+    }, index=index)
+    # Object column holding None, as read from Parquet by older pandas
+    demographics['site'] = pd.Series(
+        ['N/A', None, 'S1', 'S2'], index=demographics.index, dtype=object
+    )
+
+    expected = _pipeline(tmp_path, 'pandas').execute({'demographics_maindata': demographics})
+    actual = _pipeline(tmp_path, 'arrow').execute({'demographics_maindata': demographics})
+
+    actual = actual['demographics_maindata']
+    pd.testing.assert_frame_equal(actual, expected['demographics_maindata'])
+    assert actual.index.tolist() == ([0, 1, 3] if index is None else [10, 11, 13])
+    assert actual['site'].tolist() == [None, None, 'S2']
+    assert expected['demographics_maindata']['age_OUT_OF_RANGE'].tolist() == [False, True, False]
+
+
+def test_noop_rules_pass_frames_through(tmp_path):
+    pipeline = _pipeline(tmp_path, 'pandas')
+    df = pd.DataFrame({'FACPATID': ['P1', 'P2'], 'AGE': [5.0, -999.0]})
+
+    dedupe = {'action': 'drop_duplicates', 'subset': ['FACPATID']}
+    missing = {'action': 'replace_missing', 'values': ['N/A'], 'replace_with': None}
+    assert pipeline._apply_rule(dedupe, df, 'demographics_maindata') is df
+    assert pipeline._apply_rule(missing, df, 'demographics_maindata') is df
+
+    # Dict values are per-column replacements for DataFrame.replace
+    by_column = {'action': 'replace_missing', 'values': {'AGE': -999.0}, 'replace_with': None}
+    replaced = pipeline._apply_rule(by_column, df, 'demographics_maindata')
+    assert replaced['AGE'].isna().tolist() == [False, True]
+    assert replaced['FACPATID'].tolist() == ['P1', 'P2']
+
+
+def test_parse_dates_tries_each_format_in_order(tmp_path):
+    pipeline = _pipeline(tmp_path, 'pandas')
+    df = pd.DataFrame({'BIRTH_DATE': ['2011-02-01', '01/02/2011', 'bad', None, '2011-02-01']})
+    rule = {'action': 'parse_dates', 'columns': ['BIRTH_DATE'], 'formats': ['%Y-%m-%d', '%m/%d/%Y']}
+
+    parsed = pipeline._apply_rule(rule, df, 'demographics_maindata')['BIRTH_DATE']
+
+    assert parsed.tolist()[:2] == [pd.Timestamp('2011-02-01'), pd.Timestamp('2011-01-02')]
+    assert parsed.isna().tolist() == [False, False, True, True, False]
+
+
+def test_already_converted_columns_are_left_alone(tmp_path):
+    pipeline = _pipeline(tmp_path, 'pandas')
+    df = pd.DataFrame({
+        'BIRTH_DATE': pd.to_datetime(['2011-02-01', None]),
+        'FACPATID': pd.array(['P1', 'P2'], dtype='string[pyarrow]'),
+    })
+
+    dates = {'action': 'parse_dates', 'columns': ['BIRTH_DATE'], 'formats': ['%m/%d/%Y']}
+    ids = {'action': 'enforce_dtype', 'columns': ['FACPATID'], 'dtype': 'string'}
+    assert pipeline._apply_rule(dates, df, 'demographics_maindata') is df
+    assert pipeline._apply_rule(ids, df, 'demographics_maindata') is df
+
+    # Other targets still cast
+    as_object = dict(ids, dtype='object')
+    assert pipeline._apply_rule(as_object, df, 'demographics_maindata')['FACPATID'].dtype == object